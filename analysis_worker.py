@@ -10,7 +10,8 @@ import os  # ✅ ADDED
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
-def resize_with_aspect_ratio(frame, target_width, target_height, background_color=(0, 0, 0)):
+def resize_with_aspect_ratio(frame, target_width, target_height, background_color=(0, 0, 0),
+                             interpolation=cv2.INTER_LINEAR):
     """
     Resize frame while preserving aspect ratio and adding letterboxing/pillarboxing
     """
@@ -26,7 +27,7 @@ def resize_with_aspect_ratio(frame, target_width, target_height, background_colo
         new_height = int(target_width / source_aspect)
         
         # Resize to fit width
-        resized = cv2.resize(frame, (new_width, new_height))
+        resized = cv2.resize(frame, (new_width, new_height), interpolation=interpolation)
         
         # Create target canvas with black background
         result = np.full((target_height, target_width, 3), background_color, dtype=np.uint8)
@@ -41,7 +42,7 @@ def resize_with_aspect_ratio(frame, target_width, target_height, background_colo
         new_width = int(target_height * source_aspect)
         
         # Resize to fit height
-        resized = cv2.resize(frame, (new_width, new_height))
+        resized = cv2.resize(frame, (new_width, new_height), interpolation=interpolation)
         
         # Create target canvas with black background
         result = np.full((target_height, target_width, 3), background_color, dtype=np.uint8)
@@ -46,133 +46,87 @@ class BackgroundManager:
 
         return list(self.backgrounds.keys())
 
-    def create_background(self, name, width=1920, height=1080):
+    def create_background(self, name, width=1920, height=1080, color_order='BGR'):
 
-        """Create background by name"""
+        """Create background by name (color_order 'RGB' skips a later BGR→RGB conversion)"""
 
         if name in self.backgrounds:
 
-            return self.backgrounds[name](width, height)
+            return self.backgrounds[name](width, height, color_order)
 
         else:
 
-            return self.create_dark_gradient(width, height)
+            return self.create_dark_gradient(width, height, color_order)
 
-    def create_dark_gradient(self, width, height):
+    def create_background_with_ui(self, name, width=1920, height=1080, color_order='BGR'):
 
-        """Dark blue to black gradient - professional"""
-
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        """Create background by name with the UI elements stamped into the same buffer"""
 
-        for y in range(height):
+        # Gradients are written straight into the final array and the UI stamps only touch small ROIs
 
-            color_factor = y / height
+        return self.add_simple_ui_elements(self.create_background(name, width, height, color_order))
 
-            frame[y, :] = [
+    def _order(self, color, color_order):
 
-                int(20 + color_factor * 15),   # Blue
+        """Return a BGR color tuple in the requested channel order"""
 
-                int(15 + color_factor * 10),   # Green  
+        return tuple(reversed(color)) if color_order == 'RGB' else tuple(color)
 
-                int(5 + color_factor * 5)      # Red
+    def _vertical_gradient(self, width, height, start, delta, color_order):
 
-            ]
+        """Vectorized top-to-bottom gradient: start + y/height * delta per channel (BGR)"""
 
-        return frame
+        color_factor = np.arange(height, dtype=np.float64)[:, None] / height
 
-    def create_blue_gradient(self, width, height):
+        column = (np.array(self._order(start, color_order)) + color_factor * np.array(self._order(delta, color_order))).astype(np.uint8)
 
-        """Classic blue gradient"""
+        return np.ascontiguousarray(np.broadcast_to(column[:, None, :], (height, width, 3)))
 
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+    def create_dark_gradient(self, width, height, color_order='BGR'):
 
-        for y in range(height):
-
-            color_factor = y / height
-
-            frame[y, :] = [
-
-                int(100 + color_factor * 155),  # Blue
+        """Dark blue to black gradient - professional"""
 
-                int(20 + color_factor * 40),    # Green  
+        return self._vertical_gradient(width, height, (20, 15, 5), (15, 10, 5), color_order)
 
-                int(10 + color_factor * 20)     # Red
+    def create_blue_gradient(self, width, height, color_order='BGR'):
 
-            ]
+        """Classic blue gradient"""
 
-        return frame
+        return self._vertical_gradient(width, height, (100, 20, 10), (155, 40, 20), color_order)
 
-    def create_green_gradient(self, width, height):
+    def create_green_gradient(self, width, height, color_order='BGR'):
 
         """Green gaming gradient"""
 
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-
-        for y in range(height):
-
-            color_factor = y / height
-
-            frame[y, :] = [
-
-                int(10 + color_factor * 20),    # Blue
-
-                int(50 + color_factor * 100),   # Green  
-
-                int(5 + color_factor * 15)      # Red
-
-            ]
-
-        return frame
+        return self._vertical_gradient(width, height, (10, 50, 5), (20, 100, 15), color_order)
 
-    def create_purple_gaming(self, width, height):
+    def create_purple_gaming(self, width, height, color_order='BGR'):
 
         """Purple gaming aesthetic"""
 
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-
-        for y in range(height):
-
-            color_factor = y / height
+        color_factor = np.arange(height, dtype=np.float64)[:, None] / height
 
-            for x in range(width):
+        x_factor = np.arange(width, dtype=np.float64)[None, :] / width
 
-                x_factor = x / width
+        frame = np.empty((height, width, 3), dtype=np.uint8)
 
-                frame[y, x] = [
+        blue, green, red = self._order((0, 1, 2), color_order)
 
-                    int(80 + color_factor * 80 + x_factor * 20),   # Blue
+        frame[..., blue] = 80 + color_factor * 80 + x_factor * 20
 
-                    int(20 + color_factor * 30),                   # Green  
+        frame[..., green] = 20 + color_factor * 30
 
-                    int(60 + color_factor * 60 + x_factor * 30)    # Red
-
-                ]
+        frame[..., red] = 60 + color_factor * 60 + x_factor * 30
 
         return frame
 
-    def create_orange_sunset(self, width, height):
+    def create_orange_sunset(self, width, height, color_order='BGR'):
 
         """Orange sunset gradient"""
 
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-
-        for y in range(height):
-
-            color_factor = y / height
-
-            frame[y, :] = [
-
-                int(20 + color_factor * 40),    # Blue
-
-                int(60 + color_factor * 120),   # Green  
-
-                int(100 + color_factor * 155)   # Red
+        return self._vertical_gradient(width, height, (20, 60, 100), (40, 120, 155), color_order)
 
-            ]
-
-        return frame
-
-    def create_cyberpunk(self, width, height):
+    def create_cyberpunk(self, width, height, color_order='BGR'):
 
         """Cyberpunk neon style"""
 
@@ -180,7 +134,7 @@ class BackgroundManager:
 
         # Base dark background
 
-        frame[:, :] = [15, 25, 40]  # Dark blue-gray
+        frame[:, :] = self._order((15, 25, 40), color_order)  # Dark blue-gray
 
         # Add some horizontal neon lines
 
@@ -188,33 +142,23 @@ class BackgroundManager:
 
             if i < height - 2:
 
-                frame[i:i+2, :] = [255, 100, 150]  # Neon pink line
+                frame[i:i+2, :] = self._order((255, 100, 150), color_order)  # Neon pink line
 
         # Add vertical accent
 
         center_x = width // 2
 
-        frame[:, center_x-1:center_x+1] = [100, 255, 200]  # Neon cyan
+        frame[:, center_x-1:center_x+1] = self._order((100, 255, 200), color_order)  # Neon cyan
 
         return frame
 
-    def create_minimal_gray(self, width, height):
+    def create_minimal_gray(self, width, height, color_order='BGR'):
 
         """Minimal gray gradient"""
 
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-
-        for y in range(height):
-
-            color_factor = y / height
-
-            gray_value = int(30 + color_factor * 50)
-
-            frame[y, :] = [gray_value, gray_value, gray_value]
-
-        return frame
+        return self._vertical_gradient(width, height, (30, 30, 30), (50, 50, 50), color_order)
 
-    def create_solid_black(self, width, height):
+    def create_solid_black(self, width, height, color_order='BGR'):
 
         """Simple black background"""
 
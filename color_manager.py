@@ -6,6 +6,8 @@ Handles color selection dialogs and color conversion utilities
 
 """
 
+from functools import partial
+
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QLineEdit, QPushButton, QColorDialog, QMessageBox
 
 from PyQt6.QtGui import QColor
@@ -158,7 +160,7 @@ class ColorSelectionDialog(QDialog):
 
                 btn.setStyleSheet(f"background-color: {color}; color: white; border: 1px solid #333;")
 
-            btn.clicked.connect(lambda checked, c=color: self.set_both_colors(c))
+            btn.clicked.connect(partial(self.set_both_colors, color))
 
             preset_layout.addWidget(btn)
 
@@ -212,9 +214,9 @@ class ColorSelectionDialog(QDialog):
 
             self.frametime_color_edit.setText(color.name())
 
-    def set_both_colors(self, color):
+    def set_both_colors(self, color, checked=False):
 
-        """Set both colors to the same value"""
+        """Set both colors to the same value (checked comes from QPushButton.clicked)"""
 
         self.framerate_color_edit.setText(color)
 
@@ -791,7 +791,7 @@ class FPSStatisticsElement(OverlayElement):
         effective_scale = self.scale_factor * self.resolution_scale
         
         # Calculate statistics
-        if global_fps_values and len(global_fps_values) > 0:
+        if global_fps_values is not None and len(global_fps_values) > 0:
             avg_fps = sum(global_fps_values) / len(global_fps_values)
             min_fps = min(global_fps_values)
             max_fps = max(global_fps_values)
@@ -886,7 +886,7 @@ class FrameTimeStatisticsElement(OverlayElement):
         effective_scale = self.scale_factor * self.resolution_scale
         
         # Calculate statistics
-        if global_frame_times and len(global_frame_times) > 0:
+        if global_frame_times is not None and len(global_frame_times) > 0:
             ft_avg = sum(global_frame_times) / len(global_frame_times)
             ft_max = max(global_frame_times)
         else:
@@ -19,6 +19,10 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Union, Any
 import time
 import platform
+import json
+import hashlib
+import threading
+import functools
 
 # Import core functionality
 try:
@@ -70,6 +74,10 @@ except ImportError:
     class SystemFontDiscovery:
         def __init__(self):
             self.system_fonts = []
+            self.font_dirs = []
+        
+        def set_fonts(self, fonts):
+            self.system_fonts = list(fonts)
         
         def discover_fonts(self):
             return []
@@ -81,7 +89,7 @@ except ImportError:
             return []
     
     class PillowOpenCVBridge:
-        def __init__(self, cache_size=50):
+        def __init__(self, cache_size=50, font_discovery=None):
             self.available = PILLOW_AVAILABLE
         
         def load_system_font(self, font_name, size=24, bold=False, italic=False):
@@ -100,41 +108,148 @@ except ImportError:
             size, _ = cv2.getTextSize(text, font_face, 0.8, 1)
             return size
 
+# Optional JIT compilation for numeric preview helpers
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Pre-rasterized glyph atlas for the per-frame overlay texts (digits, "FPS", "ms")
+try:
+    from font_renderer import GlyphAtlas, get_glyph_atlas, render_atlas_text
+    GLYPH_ATLAS_AVAILABLE = PILLOW_AVAILABLE
+except ImportError:
+    GLYPH_ATLAS_AVAILABLE = False
+
 # Import Qt Components for dialog
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QComboBox, QSpinBox, QCheckBox, QSlider,
                              QGroupBox, QTabWidget, QWidget, QListWidget, 
                              QListWidgetItem, QSplitter, QTextEdit, QProgressBar,
-                             QFrame, QScrollArea)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize
+                             QFrame, QScrollArea, QSizePolicy)
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, pyqtSignal, pyqtSlot, QSize, QRect, QPoint
 from PyQt6.QtGui import QFont, QPixmap, QImage, QPainter, QColor
 
+# Preview info text for the font selection dialog. The capability lines are
+# constant for the lifetime of the process, so they are baked in once.
+_TRUETYPE_SUPPORT_LINE = ('✅ Pillow available' if PILLOW_AVAILABLE else
+                          '✅ FreeType available' if FREETYPE_AVAILABLE else '❌ Not available')
+_UNICODE_SUPPORT_LINE = '✅ Available' if PILLOW_AVAILABLE else '⚠️ Limited'
+_PREVIEW_INFO_TEMPLATE = ("""🎯 Current Element: {element}
+🎨 Font: {font_name}
+🔧 Type: {quality_info}
+📏 Size: {size} | 🖊️ Thickness: {thickness}
+💪 Bold: {bold} | 📐 Italic: {italic} | 🔲 Border: {border}
+
+📊 Font Capabilities:
+   • TrueType Support: """ + _TRUETYPE_SUPPORT_LINE + """
+   • Anti-Aliasing: ✅ Enabled
+   • Unicode Support: """ + _UNICODE_SUPPORT_LINE + """
+
+📝 All Font Elements:
+{elements}
+
+💡 Tip: TrueType fonts offer superior quality and smoother rendering!""")
+
+# OpenCV Hershey font lookup tables, built once instead of per settings instance
+_OPENCV_FONTS = {
+    'HERSHEY_SIMPLEX': cv2.FONT_HERSHEY_SIMPLEX,
+    'HERSHEY_PLAIN': cv2.FONT_HERSHEY_PLAIN,
+    'HERSHEY_DUPLEX': cv2.FONT_HERSHEY_DUPLEX,
+    'HERSHEY_COMPLEX': cv2.FONT_HERSHEY_COMPLEX,
+    'HERSHEY_TRIPLEX': cv2.FONT_HERSHEY_TRIPLEX,
+    'HERSHEY_COMPLEX_SMALL': cv2.FONT_HERSHEY_COMPLEX_SMALL,
+    'HERSHEY_SCRIPT_SIMPLEX': cv2.FONT_HERSHEY_SCRIPT_SIMPLEX,
+    'HERSHEY_SCRIPT_COMPLEX': cv2.FONT_HERSHEY_SCRIPT_COMPLEX
+}
+_OPENCV_FONT_NAMES = {font: name for name, font in _OPENCV_FONTS.items()}
+
+# Max cached get_text_size results per OpenCVFontSettings instance
+_TEXT_SIZE_CACHE_LIMIT = 512
+
+def _border_offsets(border_thickness: int) -> Tuple[Tuple[int, int], ...]:
+    """Offsets for stamping a text border: N/S/E/W, plus diagonals from 3px up"""
+    bt = border_thickness
+    offsets = ((-bt, 0), (bt, 0), (0, -bt), (0, bt))
+    if bt >= 3:
+        offsets += ((-bt, -bt), (-bt, bt), (bt, -bt), (bt, bt))
+    return offsets
+
+# One Pillow bridge for all font settings: its ImageFont cache is keyed by
+# (font, size, bold, italic), so clones and per-frame scaled lookups reuse
+# the already parsed faces instead of filling a fresh cache per instance.
+_shared_pillow_bridge = None
+_shared_pillow_bridge_lock = threading.Lock()
+
+def _new_pillow_bridge():
+    """Create a Pillow bridge with its own font cache (None without Pillow)"""
+    if not PILLOW_AVAILABLE:
+        return None
+    # Share the manager's (disk-cached) font list for name lookups
+    return PillowOpenCVBridge(font_discovery=get_font_manager().font_discovery)
+
+def _get_pillow_bridge():
+    """Get the shared Pillow bridge (None without Pillow)"""
+    global _shared_pillow_bridge
+    if not PILLOW_AVAILABLE:
+        return None
+    if _shared_pillow_bridge is None:
+        with _shared_pillow_bridge_lock:
+            if _shared_pillow_bridge is None:
+                _shared_pillow_bridge = _new_pillow_bridge()
+    return _shared_pillow_bridge
+
+# The shared bridge and FreeType faces are used from the GUI thread and the
+# AnalysisWorker thread; Pillow and cv2 FreeType faces are not thread-safe,
+# so every shared-font load, measure and render holds this lock
+_font_render_lock = threading.RLock()
+
+@functools.lru_cache(maxsize=32)
+def _load_freetype_font(font_path):
+    """Load an OpenCV FreeType2 face once per font file"""
+    freetype_font = cv2.freetype.createFreeType2()
+    freetype_font.loadFontData(fontFileName=font_path, id=0)
+    return freetype_font
+
 class OpenCVFontSettings:
     """Enhanced font settings with TrueType support - IMPROVED SCALING"""
     
+    # Fixed attribute layout: no per-instance __dict__, faster attribute reads
+    __slots__ = (
+        'font_path', 'font_name', 'size', 'thickness', 'bold', 'italic',
+        'border_thickness', 'border_color', 'text_color', 'line_spacing', 'letter_spacing',
+        '_freetype_font', '_opencv_font', '_is_freetype_ready', '_pillow_bridge',
+        '_pillow_font', '_pillow_base_size', '_text_size_cache', '_qfont', '_qfont_key',
+        '_shared_fonts', '_render_lock'
+    )
+    
+    # Qt families used to approximate the OpenCV fonts in the UI
+    _QFONT_FAMILY = {
+        'HERSHEY_SIMPLEX': 'Arial',
+        'HERSHEY_PLAIN': 'Arial',
+        'HERSHEY_DUPLEX': 'Consolas',
+        'HERSHEY_COMPLEX': 'Arial Black',
+        'HERSHEY_TRIPLEX': 'Impact',
+        'HERSHEY_COMPLEX_SMALL': 'Arial',
+        'HERSHEY_SCRIPT_SIMPLEX': 'Times New Roman',
+        'HERSHEY_SCRIPT_COMPLEX': 'Georgia'
+    }
+    
     def __init__(self, font_path: str = None, font_name: str = 'HERSHEY_SIMPLEX', 
                 size: float = 1.0, thickness: int = 2, bold: bool = False,
                 italic: bool = False, border_thickness: int = 2,
                 border_color: Tuple[int, int, int] = (0, 0, 0),
                 text_color: Tuple[int, int, int] = (255, 255, 255),
-                line_spacing: float = 1.2, letter_spacing: float = 0.0):
+                line_spacing: float = 1.2, letter_spacing: float = 0.0,
+                shared_fonts: bool = True):
         
         # FIXED: Ensure font_name is a string, converting if necessary
         if not isinstance(font_name, str):
             print(f"⚠️ Warning: Non-string font_name detected ({type(font_name)}), converting to string")
             if isinstance(font_name, int):
                 # Handle int directly for cv2 constants
-                cv2_font_mapping = {
-                    cv2.FONT_HERSHEY_SIMPLEX: 'HERSHEY_SIMPLEX',
-                    cv2.FONT_HERSHEY_PLAIN: 'HERSHEY_PLAIN',
-                    cv2.FONT_HERSHEY_DUPLEX: 'HERSHEY_DUPLEX',
-                    cv2.FONT_HERSHEY_COMPLEX: 'HERSHEY_COMPLEX',
-                    cv2.FONT_HERSHEY_TRIPLEX: 'HERSHEY_TRIPLEX',
-                    cv2.FONT_HERSHEY_COMPLEX_SMALL: 'HERSHEY_COMPLEX_SMALL',
-                    cv2.FONT_HERSHEY_SCRIPT_SIMPLEX: 'HERSHEY_SCRIPT_SIMPLEX',
-                    cv2.FONT_HERSHEY_SCRIPT_COMPLEX: 'HERSHEY_SCRIPT_COMPLEX'
-                }
-                font_name = cv2_font_mapping.get(font_name, 'HERSHEY_SIMPLEX')
+                font_name = _OPENCV_FONT_NAMES.get(font_name, 'HERSHEY_SIMPLEX')
             else:
                 # For any other type, convert to string
                 font_name = str(font_name)
@@ -158,16 +273,25 @@ class OpenCVFontSettings:
         self._freetype_font = None
         self._opencv_font = None
         self._is_freetype_ready = False
-        self._pillow_bridge = PillowOpenCVBridge() if PILLOW_AVAILABLE else None
+        # shared_fonts=False gives this object its own font handles, for use on
+        # another thread (Pillow and cv2 FreeType faces are not thread-safe)
+        self._shared_fonts = shared_fonts
+        self._render_lock = _font_render_lock if shared_fonts else threading.RLock()
+        self._pillow_bridge = _get_pillow_bridge() if shared_fonts else _new_pillow_bridge()
         self._pillow_font = None
+        self._text_size_cache = {}
+        self._qfont = None
+        self._qfont_key = None
         
         # Initialize fonts
         self._initialize_fonts()
     
     def _initialize_fonts(self):
         """Initialize both FreeType and OpenCV fonts"""
-        self._initialize_freetype()
-        self._initialize_opencv()
+        with self._render_lock:
+            self._text_size_cache = {}
+            self._initialize_freetype()
+            self._initialize_opencv()
     
     def _initialize_freetype(self):
         """Initialize FreeType/Pillow font if available"""
@@ -216,20 +340,16 @@ class OpenCVFontSettings:
         
         try:
             if self.font_path and os.path.exists(self.font_path):
-                self._freetype_font = cv2.freetype.createFreeType2()
-                self._freetype_font.loadFontData(fontFileName=self.font_path, id=0)
+                self._freetype_font = self._load_freetype(self.font_path)
                 self._is_freetype_ready = True
                 debug_log(f"FreeType font loaded: {self.font_name}")
             else:
                 # Try to find font by name
                 if self.font_path is None and not self.font_name.startswith('HERSHEY'):
-                    discovery = SystemFontDiscovery()
-                    discovery.discover_fonts()
-                    font_info = discovery.get_font_by_name(self.font_name)
+                    font_info = get_font_manager().get_font_by_name(self.font_name)
                     if font_info:
                         self.font_path = font_info['path']
-                        self._freetype_font = cv2.freetype.createFreeType2()
-                        self._freetype_font.loadFontData(fontFileName=self.font_path, id=0)
+                        self._freetype_font = self._load_freetype(self.font_path)
                         self._is_freetype_ready = True
                         debug_log(f"FreeType font found and loaded: {self.font_name}")
         except Exception as e:
@@ -237,19 +357,14 @@ class OpenCVFontSettings:
             self._freetype_font = None
             self._is_freetype_ready = False
     
+    def _load_freetype(self, font_path):
+        """FreeType2 face for font_path, private unless fonts are shared"""
+        if self._shared_fonts:
+            return _load_freetype_font(font_path)
+        return _load_freetype_font.__wrapped__(font_path)
+    
     def _initialize_opencv(self):
         """Initialize fallback OpenCV font - FIXED for integer font_name issue"""
-        font_mapping = {
-            'HERSHEY_SIMPLEX': cv2.FONT_HERSHEY_SIMPLEX,
-            'HERSHEY_PLAIN': cv2.FONT_HERSHEY_PLAIN,
-            'HERSHEY_DUPLEX': cv2.FONT_HERSHEY_DUPLEX,
-            'HERSHEY_COMPLEX': cv2.FONT_HERSHEY_COMPLEX,
-            'HERSHEY_TRIPLEX': cv2.FONT_HERSHEY_TRIPLEX,
-            'HERSHEY_COMPLEX_SMALL': cv2.FONT_HERSHEY_COMPLEX_SMALL,
-            'HERSHEY_SCRIPT_SIMPLEX': cv2.FONT_HERSHEY_SCRIPT_SIMPLEX,
-            'HERSHEY_SCRIPT_COMPLEX': cv2.FONT_HERSHEY_SCRIPT_COMPLEX
-        }
-        
         # FIXED: Handle case where font_name might be an integer
         if isinstance(self.font_name, int):
             print(f"⚠️ Warning: font_name is an integer ({self.font_name}), using HERSHEY_SIMPLEX as fallback")
@@ -259,8 +374,8 @@ class OpenCVFontSettings:
             return
         
         # If font_name is an OpenCV font
-        if self.font_name in font_mapping:
-            self._opencv_font = font_mapping[self.font_name]
+        if self.font_name in _OPENCV_FONTS:
+            self._opencv_font = _OPENCV_FONTS[self.font_name]
         else:
             # Try to map TrueType font to best OpenCV equivalent
             try:
@@ -298,15 +413,16 @@ class OpenCVFontSettings:
     def render_text(self, img: np.ndarray, text: str, position: Tuple[int, int],
                 scale_factor: float = 1.0) -> np.ndarray:
         """Render text with the best available method - FIXED"""
-        # Pillow method (first priority)
-        if PILLOW_AVAILABLE and self._pillow_font is not None:
-            return self._render_pillow_text(img, text, position, scale_factor)
-        # FreeType method (second priority)
-        elif self.is_freetype_available():
-            return self._render_freetype_text(img, text, position, scale_factor)
-        # Standard OpenCV method (fallback)
-        else:
-            return self._render_opencv_text(img, text, position, scale_factor)
+        with self._render_lock:
+            # Pillow method (first priority)
+            if PILLOW_AVAILABLE and self._pillow_font is not None:
+                return self._render_pillow_text(img, text, position, scale_factor)
+            # FreeType method (second priority)
+            elif self.is_freetype_available():
+                return self._render_freetype_text(img, text, position, scale_factor)
+            # Standard OpenCV method (fallback)
+            else:
+                return self._render_opencv_text(img, text, position, scale_factor)
 
     def _render_pillow_text(self, img: np.ndarray, text: str, 
                         position: Tuple[int, int], scale_factor: float) -> np.ndarray:
@@ -347,6 +463,17 @@ class OpenCVFontSettings:
             # Scale border thickness consistently
             border_thickness = max(1, int(self.border_thickness * scale_factor))
             
+            # Per-frame texts (FPS values, axis labels) only use a small fixed
+            # character set: blit cached glyph masks instead of re-drawing the
+            # text (2b+1)^2 times through the bridge's border loop every frame
+            if GLYPH_ATLAS_AVAILABLE and GlyphAtlas.covers(text):
+                atlas = get_glyph_atlas(font_to_use, border_thickness if self.border_thickness > 0 else 0)
+                y_offset = -int(font_to_use.size * 0.25) if hasattr(font_to_use, 'size') else -8
+                return render_atlas_text(
+                    img, text, (position[0], position[1] + y_offset), atlas,
+                    self.text_color, self.border_color
+                )
+            
             # Use Pillow bridge for rendering and RETURN THE RESULT
             return self._pillow_bridge.render_text(
                 img, text, position, 
@@ -374,14 +501,12 @@ class OpenCVFontSettings:
                 border_size = max(1, int(self.border_thickness * scale_factor))
                 
                 # Border with multiple passes for smooth effect
-                for dx in range(-border_size, border_size + 1):
-                    for dy in range(-border_size, border_size + 1):
-                        if dx != 0 or dy != 0:
-                            self._freetype_font.putText(
-                                img, text, (x + dx, y + dy), font_height,
-                                self.border_color, self.get_effective_thickness(),
-                                cv2.LINE_AA, False
-                            )
+                for dx, dy in _border_offsets(border_size):
+                    self._freetype_font.putText(
+                        img, text, (x + dx, y + dy), font_height,
+                        self.border_color, self.get_effective_thickness(),
+                        cv2.LINE_AA, False
+                    )
             
             # Main text with anti-aliasing
             self._freetype_font.putText(
@@ -410,11 +535,9 @@ class OpenCVFontSettings:
         # Render border
         if self.border_thickness > 0:
             border_thickness = max(1, int(self.border_thickness * scale_factor))
-            for dx in range(-border_thickness, border_thickness + 1):
-                for dy in range(-border_thickness, border_thickness + 1):
-                    if dx != 0 or dy != 0:
-                        cv2.putText(img, text, (x + dx, y + dy), self._opencv_font,
-                                  font_scale, self.border_color, thickness + 1, cv2.LINE_AA)
+            for dx, dy in _border_offsets(border_thickness):
+                cv2.putText(img, text, (x + dx, y + dy), self._opencv_font,
+                          font_scale, self.border_color, thickness + 1, cv2.LINE_AA)
         
         # Render main text
         cv2.putText(img, text, position, self._opencv_font,
@@ -423,7 +546,19 @@ class OpenCVFontSettings:
         return img
     
     def get_text_size(self, text: str, scale_factor: float = 1.0) -> Tuple[int, int]:
-        """Get text dimensions with improved scaling consistency"""
+        """Get text dimensions, cached until the font is reinitialized"""
+        key = (text, round(scale_factor, 3), self.size, self.thickness, self.bold, self.italic)
+        size = self._text_size_cache.get(key)
+        if size is None:
+            if len(self._text_size_cache) >= _TEXT_SIZE_CACHE_LIMIT:
+                self._text_size_cache.clear()
+            with self._render_lock:
+                size = self._measure_text(text, scale_factor)
+            self._text_size_cache[key] = size
+        return size
+    
+    def _measure_text(self, text: str, scale_factor: float) -> Tuple[int, int]:
+        """Measure text dimensions with improved scaling consistency"""
         # Improved Pillow text size calculation
         if PILLOW_AVAILABLE and self._pillow_font is not None:
             try:
@@ -501,27 +636,21 @@ class OpenCVFontSettings:
     
     def to_qfont(self):
         """Convert to QFont for UI compatibility"""
-        if self.font_name.startswith('HERSHEY'):
-            # Map OpenCV fonts to Qt fonts
-            font_mapping = {
-                'HERSHEY_SIMPLEX': 'Arial',
-                'HERSHEY_PLAIN': 'Arial',
-                'HERSHEY_DUPLEX': 'Consolas',
-                'HERSHEY_COMPLEX': 'Arial Black',
-                'HERSHEY_TRIPLEX': 'Impact',
-                'HERSHEY_COMPLEX_SMALL': 'Arial',
-                'HERSHEY_SCRIPT_SIMPLEX': 'Times New Roman',
-                'HERSHEY_SCRIPT_COMPLEX': 'Georgia'
-            }
-            qt_family = font_mapping.get(self.font_name, 'Arial')
-        else:
-            qt_family = self.font_name
-        
-        qt_size = max(8, int(self.size * 12))  # Convert to reasonable Qt size
-        qfont = QFont(qt_family, qt_size)
-        qfont.setBold(self.bold)
-        qfont.setItalic(self.italic)
-        return qfont
+        # Reuse the resolved QFont until a relevant setting changes
+        key = (self.font_name, self.size, self.bold, self.italic)
+        if key != self._qfont_key:
+            if self.font_name.startswith('HERSHEY'):
+                # Map OpenCV fonts to Qt fonts
+                qt_family = self._QFONT_FAMILY.get(self.font_name, 'Arial')
+            else:
+                qt_family = self.font_name
+            
+            qt_size = max(8, int(self.size * 12))  # Convert to reasonable Qt size
+            self._qfont = QFont(qt_family, qt_size)
+            self._qfont.setBold(self.bold)
+            self._qfont.setItalic(self.italic)
+            self._qfont_key = key
+        return QFont(self._qfont)
 
 
 # ===============================================
@@ -533,22 +662,122 @@ class FontDiscoveryThread(QThread):
     fonts_discovered = pyqtSignal(list)
     progress_update = pyqtSignal(str)
     
-    def __init__(self):
-        super().__init__()
-        self.discovery = SystemFontDiscovery()
-    
     def run(self):
         """Run font discovery in background"""
         self.progress_update.emit("🔍 Scanning system fonts...")
-        fonts = self.discovery.discover_fonts()
+        fonts = get_font_manager().available_fonts
         self.fonts_discovered.emit(fonts)
 
 # ===============================================
 # 🎨 ENHANCED FONT SELECTION DIALOG
 # ===============================================
 
+# OpenCV fonts listed in the selection dialog, with their list labels
+_OPENCV_FONT_ENTRIES = [
+    (font, f"🔧 {font['name']} • {font['description']}") for font in [
+        {'name': 'Hershey Simplex', 'path': 'HERSHEY_SIMPLEX', 'type': 'opencv', 'description': 'Clean, readable'},
+        {'name': 'Hershey Complex', 'path': 'HERSHEY_COMPLEX', 'type': 'opencv', 'description': 'Bold, strong'},
+        {'name': 'Hershey Duplex', 'path': 'HERSHEY_DUPLEX', 'type': 'opencv', 'description': 'Monospace'},
+        {'name': 'Hershey Triplex', 'path': 'HERSHEY_TRIPLEX', 'type': 'opencv', 'description': 'Thick, bold'},
+        {'name': 'Hershey Plain', 'path': 'HERSHEY_PLAIN', 'type': 'opencv', 'description': 'Simple, thin'},
+        {'name': 'Hershey Script Simplex', 'path': 'HERSHEY_SCRIPT_SIMPLEX', 'type': 'opencv', 'description': 'Script style'},
+    ]
+]
+_SETTING_SPIN_STYLE = """
+    QSpinBox {
+        padding: 4px; border: 1px solid #555; border-radius: 4px;
+        background-color: #3c3c3c; color: #ffffff;
+    }
+"""
+_FONT_LIST_QUALITY = ("Pillow TrueType" if PILLOW_AVAILABLE else
+                      "OpenCV FreeType" if FREETYPE_AVAILABLE else "Fallback to OpenCV")
+
+class PreviewRenderWorker(QObject):
+    """Renders the font selection preview on a background thread"""
+    rendered = pyqtSignal(int, QImage)
+    failed = pyqtSignal(int, str)
+    
+    def __init__(self):
+        super().__init__()
+        self._background = None
+        self._canvas = None
+        self._settings_cache = {}
+    
+    def _own_settings(self, data):
+        """Worker-owned font settings for a to_dict() snapshot, never shared with the GUI thread"""
+        key = tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in data.items())
+        settings = self._settings_cache.get(key)
+        if settings is None:
+            if len(self._settings_cache) >= 32:
+                self._settings_cache.clear()
+            settings = OpenCVFontSettings(shared_fonts=False, **data)
+            self._settings_cache[key] = settings
+        return settings
+    
+    def create_preview_background(self, width, height):
+        """Create the static gradient + grid background for the preview"""
+        background = np.empty((height, width, 3), dtype=np.uint8)
+        
+        # Enhanced background gradient
+        intensity = (15 + np.arange(height) * 35 / height).astype(np.uint8)
+        background[:, :, 0] = intensity[:, None]
+        background[:, :, 1] = intensity[:, None]
+        background[:, :, 2] = np.minimum(intensity.astype(np.uint16) + 5, 255)[:, None]
+        
+        # Grid pattern for better visual context
+        grid_spacing = 40
+        background[:, ::grid_spacing] = 25
+        background[::grid_spacing, :] = 25
+        return background
+    
+    @pyqtSlot(int, int, int, object)
+    def render(self, generation, width, height, jobs):
+        """Render (text, settings dict, position, highlighted) jobs and emit the image"""
+        try:
+            # Create enhanced preview image in the persistent canvas
+            if self._canvas is None or self._canvas.shape[:2] != (height, width):
+                self._background = self.create_preview_background(width, height)
+                self._canvas = np.empty_like(self._background)
+            preview_img = self._canvas
+            np.copyto(preview_img, self._background)
+            
+            for text, settings_data, pos, highlighted in jobs:
+                settings = self._own_settings(settings_data)
+                if highlighted:
+                    # Enhanced highlighting with gradient effect, blended only
+                    # inside the highlight band instead of across the whole canvas
+                    x0, y0 = max(0, pos[0] - 15), max(0, pos[1] - 30)
+                    x1, y1 = min(width, pos[0] + 401), min(height, pos[1] + 16)
+                    if x1 > x0 and y1 > y0:
+                        band = preview_img[y0:y1, x0:x1]
+                        tint = np.full_like(band, (0, 150, 0))
+                        preview_img[y0:y1, x0:x1] = cv2.addWeighted(band, 0.7, tint, 0.3, 0)
+                
+                # Render text with current settings
+                try:
+                    result = settings.render_text(preview_img, text, pos, 1.0)
+                    if result is not None:
+                        preview_img = result
+                except Exception as e:
+                    # Fallback to OpenCV on errors
+                    debug_log(f"⚠️ Error rendering preview: {e}")
+                    cv2.putText(preview_img, text, pos, cv2.FONT_HERSHEY_SIMPLEX, 
+                            0.7, (255, 255, 255), 2, cv2.LINE_AA)
+            
+            # Hand the BGR buffer to Qt as-is (no BGR->RGB pass) and copy it,
+            # so the canvas can be reused once the image crosses threads
+            preview_img = np.ascontiguousarray(preview_img)
+            h, w, ch = preview_img.shape
+            qt_image = QImage(preview_img.data, w, h, ch * w, QImage.Format.Format_BGR888).copy()
+            self.rendered.emit(generation, qt_image)
+        except Exception as e:
+            debug_log(f"❌ Preview Error: {e}")
+            self.failed.emit(generation, str(e))
+
+
 class OpenCVFontSelectionDialog(QDialog):
     """Enhanced font selection dialog with TrueType support"""
+    preview_render_requested = pyqtSignal(int, int, int, object)
     
     def __init__(self, parent, fps_settings, framerate_settings, frametime_settings):
         super().__init__(parent)
@@ -556,25 +785,42 @@ class OpenCVFontSelectionDialog(QDialog):
         self.setMinimumSize(1400, 900)
         self.setModal(True)
         
-        # Store original settings
-        self.original_fps = fps_settings.clone() if hasattr(fps_settings, 'clone') else fps_settings
-        self.original_framerate = framerate_settings.clone() if hasattr(framerate_settings, 'clone') else framerate_settings
-        self.original_frametime = frametime_settings.clone() if hasattr(frametime_settings, 'clone') else frametime_settings
-        
-        # Current settings (working copies)
-        self.fps_settings = fps_settings.clone() if hasattr(fps_settings, 'clone') else fps_settings
-        self.framerate_settings = framerate_settings.clone() if hasattr(framerate_settings, 'clone') else framerate_settings
-        self.frametime_settings = frametime_settings.clone() if hasattr(frametime_settings, 'clone') else frametime_settings
+        # Current settings (working copies), keyed by font element
+        self.element_settings = {
+            element: settings.clone() if hasattr(settings, 'clone') else settings
+            for element, settings in (('fps', fps_settings),
+                                      ('framerate', framerate_settings),
+                                      ('frametime', frametime_settings))
+        }
+        self.fps_settings = self.element_settings['fps']
+        self.framerate_settings = self.element_settings['framerate']
+        self.frametime_settings = self.element_settings['frametime']
         
-        # Font discovery
-        self.font_discovery = SystemFontDiscovery()
+        # Font discovery (shared through the global font manager)
         self.available_fonts = []
         self.current_font_element = 'fps'  # 'fps', 'framerate', 'frametime'
         
-        # Preview
+        # Preview (a burst of setting changes restarts the timer and
+        # collapses into one font reload + render)
+        self._last_info_text = None
+        self._dirty_settings = []
+        self._auto_preview = True
+        self._last_preview_key = None
+        self._preview_generation = 0
         self.preview_timer = QTimer()
         self.preview_timer.timeout.connect(self.update_preview)
         self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(300)
+        
+        # Preview rendering runs on a worker thread so the dialog stays responsive
+        self._preview_thread = QThread(self)
+        self._preview_worker = PreviewRenderWorker()
+        self._preview_worker.moveToThread(self._preview_thread)
+        self._preview_thread.finished.connect(self._preview_worker.deleteLater)
+        self.preview_render_requested.connect(self._preview_worker.render)
+        self._preview_worker.rendered.connect(self.on_preview_rendered)
+        self._preview_worker.failed.connect(self.on_preview_failed)
+        self._preview_thread.start()
         
         self.setup_ui()
         self.start_font_discovery()
@@ -645,6 +891,7 @@ class OpenCVFontSelectionDialog(QDialog):
         
         self.auto_preview_check = QCheckBox("🔄 Auto-Preview")
         self.auto_preview_check.setChecked(True)
+        self.auto_preview_check.toggled.connect(self.on_auto_preview_toggled)
         self.auto_preview_check.setStyleSheet("color: #4CAF50; font-weight: bold;")
         preview_layout.addWidget(self.auto_preview_check)
         
@@ -808,7 +1055,8 @@ class OpenCVFontSelectionDialog(QDialog):
         self.size_slider = QSlider(Qt.Orientation.Horizontal)
         self.size_slider.setRange(8, 72)
         self.size_slider.setValue(24)
-        self.size_slider.valueChanged.connect(self.on_setting_changed)
+        self.size_slider.valueChanged.connect(lambda value: self.on_setting_changed('size', value))
+        self.size_slider.valueChanged.connect(lambda value: self.size_value.setText(str(value)))
         self.size_slider.setStyleSheet("""
             QSlider::groove:horizontal {
                 border: 1px solid #555; height: 8px; background: #3c3c3c; border-radius: 4px;
@@ -827,52 +1075,24 @@ class OpenCVFontSelectionDialog(QDialog):
         settings_layout.addLayout(size_layout)
         
         # Enhanced thickness control
-        thickness_layout = QHBoxLayout()
-        thickness_layout.addWidget(QLabel("🖊️ Thickness:"))
-        self.thickness_spin = QSpinBox()
-        self.thickness_spin.setRange(1, 10)
-        self.thickness_spin.setValue(2)
-        self.thickness_spin.valueChanged.connect(self.on_setting_changed)
-        self.thickness_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 4px; border: 1px solid #555; border-radius: 4px;
-                background-color: #3c3c3c; color: #ffffff;
-            }
-        """)
-        thickness_layout.addWidget(self.thickness_spin)
-        thickness_layout.addStretch()
-        settings_layout.addLayout(thickness_layout)
+        self.thickness_spin = self.create_setting_spin(settings_layout, "🖊️ Thickness:", 1, 10, 'thickness')
         
         # Enhanced style options
         style_layout = QHBoxLayout()
         self.bold_check = QCheckBox("💪 Bold")
-        self.bold_check.toggled.connect(self.on_setting_changed)
+        self.bold_check.toggled.connect(lambda checked: self.on_setting_changed('bold', checked))
         self.bold_check.setStyleSheet("color: #ffffff; font-weight: bold;")
         style_layout.addWidget(self.bold_check)
         
         self.italic_check = QCheckBox("📐 Italic")
-        self.italic_check.toggled.connect(self.on_setting_changed)
+        self.italic_check.toggled.connect(lambda checked: self.on_setting_changed('italic', checked))
         self.italic_check.setStyleSheet("color: #ffffff; font-weight: bold;")
         style_layout.addWidget(self.italic_check)
         style_layout.addStretch()
         settings_layout.addLayout(style_layout)
         
         # Enhanced border control
-        border_layout = QHBoxLayout()
-        border_layout.addWidget(QLabel("🔲 Border:"))
-        self.border_spin = QSpinBox()
-        self.border_spin.setRange(0, 5)
-        self.border_spin.setValue(2)
-        self.border_spin.valueChanged.connect(self.on_setting_changed)
-        self.border_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 4px; border: 1px solid #555; border-radius: 4px;
-                background-color: #3c3c3c; color: #ffffff;
-            }
-        """)
-        border_layout.addWidget(self.border_spin)
-        border_layout.addStretch()
-        settings_layout.addLayout(border_layout)
+        self.border_spin = self.create_setting_spin(settings_layout, "🔲 Border:", 0, 5, 'border_thickness')
         
         left_splitter.addWidget(settings_group)
         layout.addWidget(left_splitter)
@@ -900,6 +1120,8 @@ class OpenCVFontSelectionDialog(QDialog):
             }
         """)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # The layout sizes the label, never the pixmap (lets the dialog shrink again)
+        self.preview_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         preview_layout.addWidget(self.preview_label)
         
         # Enhanced preview info
@@ -915,6 +1137,20 @@ class OpenCVFontSelectionDialog(QDialog):
         
         layout.addWidget(preview_group)
     
+    def create_setting_spin(self, settings_layout, label, minimum, maximum, field):
+        """Add a labelled spin box row that writes one font setting field"""
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(QLabel(label))
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setValue(2)
+        spin.valueChanged.connect(lambda value: self.on_setting_changed(field, value))
+        spin.setStyleSheet(_SETTING_SPIN_STYLE)
+        row_layout.addWidget(spin)
+        row_layout.addStretch()
+        settings_layout.addLayout(row_layout)
+        return spin
+    
     def start_font_discovery(self):
         """Start font discovery in background"""
         self.discovery_thread = FontDiscoveryThread()
@@ -954,7 +1190,7 @@ class OpenCVFontSelectionDialog(QDialog):
         
         # Enhanced filtering
         if filter_type == 'popular':
-            fonts_to_show = self.font_discovery.get_popular_fonts()
+            fonts_to_show = get_font_manager().get_popular_fonts()
         elif filter_type == 'ttf':
             fonts_to_show = [f for f in self.available_fonts if f['type'] == 'ttf']
         elif filter_type == 'opencv':
@@ -962,16 +1198,7 @@ class OpenCVFontSelectionDialog(QDialog):
         else:  # 'all' - zeigt ALLE Fonts
             fonts_to_show = self.available_fonts
         
-        # Add OpenCV fallback fonts first (always shown)
-        opencv_fonts = [
-            {'name': 'Hershey Simplex', 'path': 'HERSHEY_SIMPLEX', 'type': 'opencv', 'description': 'Clean, readable'},
-            {'name': 'Hershey Complex', 'path': 'HERSHEY_COMPLEX', 'type': 'opencv', 'description': 'Bold, strong'},
-            {'name': 'Hershey Duplex', 'path': 'HERSHEY_DUPLEX', 'type': 'opencv', 'description': 'Monospace'},
-            {'name': 'Hershey Triplex', 'path': 'HERSHEY_TRIPLEX', 'type': 'opencv', 'description': 'Thick, bold'},
-            {'name': 'Hershey Plain', 'path': 'HERSHEY_PLAIN', 'type': 'opencv', 'description': 'Simple, thin'},
-            {'name': 'Hershey Script Simplex', 'path': 'HERSHEY_SCRIPT_SIMPLEX', 'type': 'opencv', 'description': 'Script style'},
-        ]
-        
+        # OpenCV fallback fonts come first (always shown)
         # Add section header
         if filter_type != 'ttf':
             header = QListWidgetItem("━━━ OpenCV Standard Fonts ━━━")
@@ -980,10 +1207,7 @@ class OpenCVFontSelectionDialog(QDialog):
             header.setForeground(QColor(76, 175, 80))
             self.font_list.addItem(header)
             
-            for font in opencv_fonts:
-                icon = "🔧"
-                name = f"{icon} {font['name']} • {font['description']}"
-                
+            for font, name in _OPENCV_FONT_ENTRIES:
                 item = QListWidgetItem(name)
                 item.setData(Qt.ItemDataRole.UserRole, font)
                 self.font_list.addItem(item)
@@ -1001,8 +1225,7 @@ class OpenCVFontSelectionDialog(QDialog):
             for font in fonts_to_show:
                 icon = "🎨" if font['type'] == 'ttf' else "⚡"
                 size_mb = font['size'] / (1024*1024)
-                quality = "Pillow TrueType" if PILLOW_AVAILABLE else "OpenCV FreeType" if FREETYPE_AVAILABLE else "Fallback to OpenCV"
-                name = f"{icon} {font['name']} • {size_mb:.1f}MB • {quality}"
+                name = f"{icon} {font['name']} • {size_mb:.1f}MB • {_FONT_LIST_QUALITY}"
                 
                 item = QListWidgetItem(name)
                 item.setData(Qt.ItemDataRole.UserRole, font)
@@ -1040,27 +1263,12 @@ class OpenCVFontSelectionDialog(QDialog):
             # TrueType font - MAKE SURE THIS IS SET CORRECTLY
             current_settings.font_path = font_data['path']
             current_settings.font_name = font_data['name']
-            print(f"🔍 DEBUG: Selected TrueType font: {font_data['name']} at {font_data['path']}")
+            debug_log(f"🔍 Selected TrueType font: {font_data['name']} at {font_data['path']}")
         
         # Reinitialize font
         current_settings._initialize_fonts()
-        
-        # DEBUG: Check if Pillow font was loaded
-        print(f"🔍 DEBUG: After initialization:")
-        print(f"   - _pillow_font is None: {current_settings._pillow_font is None}")
-        print(f"   - _is_freetype_ready: {current_settings._is_freetype_ready}")
-        print(f"   - PILLOW_AVAILABLE: {PILLOW_AVAILABLE}")
-        
-        if current_settings._pillow_bridge:
-            print(f"   - _pillow_bridge exists: True")
-            # Try to load the font directly to test
-            try:
-                test_font = current_settings._pillow_bridge.load_system_font(
-                    current_settings.font_path, 24, False, False
-                )
-                print(f"   - Test font load: {test_font is not None}")
-            except Exception as e:
-                print(f"   - Test font load error: {e}")
+        debug_log(f"🔍 After initialization: pillow font loaded={current_settings._pillow_font is not None}, "
+                  f"freetype ready={current_settings._is_freetype_ready}")
         
         self.update_font_type_label()
         self.schedule_preview_update()
@@ -1096,35 +1304,43 @@ class OpenCVFontSelectionDialog(QDialog):
                 }
             """)
     
-    def on_setting_changed(self):
-        """Handle setting change"""
+    def on_auto_preview_toggled(self, checked):
+        """Remember the auto-preview state for the setting handlers"""
+        self._auto_preview = checked
+    
+    def on_setting_changed(self, field=None, value=None):
+        """Handle setting change (one field from its signal, or all from the UI)"""
         current_settings = self.get_current_settings()
         
-        # Update settings from UI
-        current_settings.size = self.size_slider.value()
-        current_settings.thickness = self.thickness_spin.value()
-        current_settings.bold = self.bold_check.isChecked()
-        current_settings.italic = self.italic_check.isChecked()
-        current_settings.border_thickness = self.border_spin.value()
-        
-        # Update UI
-        self.size_value.setText(str(self.size_slider.value()))
-        
-        # Reinitialize font - check if method exists first
-        if hasattr(current_settings, '_initialize_fonts'):
-            current_settings._initialize_fonts()
-        
-        if self.auto_preview_check.isChecked():
+        if field is not None:
+            # Value delivered by the widget's signal
+            setattr(current_settings, field, value)
+        else:
+            # Update settings from UI
+            current_settings.size = self.size_slider.value()
+            current_settings.thickness = self.thickness_spin.value()
+            current_settings.bold = self.bold_check.isChecked()
+            current_settings.italic = self.italic_check.isChecked()
+            current_settings.border_thickness = self.border_spin.value()
+        
+        # Reinitialize font lazily, once per burst of changes
+        if not any(s is current_settings for s in self._dirty_settings):
+            self._dirty_settings.append(current_settings)
+        
+        if self._auto_preview:
             self.schedule_preview_update()
     
+    def flush_font_changes(self):
+        """Reinitialize fonts of settings changed since the last render"""
+        for settings in self._dirty_settings:
+            # Check if method exists first
+            if hasattr(settings, '_initialize_fonts'):
+                settings._initialize_fonts()
+        self._dirty_settings = []
+    
     def get_current_settings(self):
         """Get current font settings"""
-        if self.current_font_element == 'fps':
-            return self.fps_settings
-        elif self.current_font_element == 'framerate':
-            return self.framerate_settings
-        else:
-            return self.frametime_settings
+        return self.element_settings.get(self.current_font_element, self.frametime_settings)
     
     def load_current_settings(self):
         """Load current settings into UI"""
@@ -1150,83 +1366,54 @@ class OpenCVFontSelectionDialog(QDialog):
     
     def schedule_preview_update(self):
         """Schedule preview update with debouncing"""
-        self.preview_timer.stop()
-        self.preview_timer.start(300)  # 300ms delay
+        self.preview_timer.start()  # Restarts the 300ms delay
     
     def force_preview_update(self):
         """Force immediate preview update"""
         self.preview_timer.stop()
+        self._last_preview_key = None
         self.update_preview()
     
     def update_preview(self):
         """Update preview with current font settings"""
+        self.flush_font_changes()
+        
+        # Skip the render when nothing visible changed (e.g. re-selecting
+        # the current value or changing the list filter)
+        label_rect = self.preview_label.contentsRect()
+        preview_width = max(580, label_rect.width())
+        preview_height = max(420, label_rect.height())
+        preview_key = (
+            tuple(_font_signature(s) for s in self.element_settings.values()),
+            self.current_font_element, preview_width, preview_height
+        )
+        if preview_key == self._last_preview_key:
+            return
+        
         try:
-            # Create enhanced preview image
-            preview_width, preview_height = 580, 420
-            preview_img = np.zeros((preview_height, preview_width, 3), dtype=np.uint8)
-            
-            # Enhanced background gradient
-            for y in range(preview_height):
-                intensity = int(15 + (y / preview_height) * 35)
-                blue_tint = min(255, intensity + 5)
-                preview_img[y, :] = [intensity, intensity, blue_tint]
-            
-            # Grid pattern for better visual context
-            grid_spacing = 40
-            for i in range(0, preview_width, grid_spacing):
-                cv2.line(preview_img, (i, 0), (i, preview_height), (25, 25, 25), 1)
-            for i in range(0, preview_height, grid_spacing):
-                cv2.line(preview_img, (0, i), (preview_width, i), (25, 25, 25), 1)
-            
             # Enhanced example texts with better positioning
+            current = self.get_current_settings()
             texts = [
                 ("FPS: 59.8", self.fps_settings, (50, 80), "Large FPS number"),
                 ("FRAME RATE GRAPH", self.framerate_settings, (50, 140), "Graph title"),
                 ("AVG: 59.2  MIN: 45.1  MAX: 60.0", self.framerate_settings, (50, 170), "Graph statistics"),
                 ("FRAME TIME", self.frametime_settings, (50, 230), "Frame time title"),
                 ("AVG: 16.8ms  MAX: 22.1ms", self.frametime_settings, (50, 260), "Frame time statistics"),
-                ("The quick brown fox jumps", self.get_current_settings(), (50, 320), "Example text"),
-                ("over the lazy dog 1234567890", self.get_current_settings(), (50, 350), "Character test"),
+                ("The quick brown fox jumps", current, (50, 320), "Example text"),
+                ("over the lazy dog 1234567890", current, (50, 350), "Character test"),
             ]
             
-            # Info collection
+            # Render jobs for the worker and info collection
+            jobs = []
             info_parts = []
             
             for text, settings, pos, description in texts:
-                # Highlight current element
-                if settings == self.get_current_settings():
-                    # Enhanced highlighting with gradient effect
-                    highlight_overlay = preview_img.copy()
-                    cv2.rectangle(highlight_overlay, 
-                                (pos[0]-15, pos[1]-30), 
-                                (pos[0]+400, pos[1]+15), 
-                                (0, 150, 0), -1)
-                    cv2.addWeighted(preview_img, 0.7, highlight_overlay, 0.3, 0, preview_img)
-                    
-                    # Arrow indicator
-                    text = f"→ {text}"
-                
-                # Render text with current settings
-                try:
-                    # Ensure text color is explicitly set
-                    original_color = settings.text_color
-                    if "→" in text:  # Highlighted text
-                        settings.text_color = (0, 255, 0)  # Brighter green for better visibility
-                    else:
-                        settings.text_color = (255, 255, 255)  # White for normal text
-                    
-                    # Render with explicit error handling
-                    result = settings.render_text(preview_img, text, pos, 1.0)
-                    if result is not None:
-                        preview_img = result
-                    
-                    # Reset color
-                    settings.text_color = original_color
-                except Exception as e:
-                    # Fallback to OpenCV on errors
-                    debug_log(f"⚠️ Error rendering preview: {e}")
-                    cv2.putText(preview_img, text, pos, cv2.FONT_HERSHEY_SIMPLEX, 
-                            0.7, (255, 255, 255), 2, cv2.LINE_AA)
+                # Highlight current element; the worker gets a plain snapshot and
+                # builds its own font objects, so nothing native crosses threads
+                highlighted = settings is current
+                job_settings = settings.to_dict()
+                job_settings['text_color'] = (0, 255, 0) if highlighted else (255, 255, 255)
+                jobs.append((f"→ {text}" if highlighted else text, job_settings, pos, highlighted))
                 
                 # Collect detailed info
                 if hasattr(settings, '_pillow_font') and settings._pillow_font is not None:
@@ -1238,24 +1425,11 @@ class OpenCVFontSelectionDialog(QDialog):
                     
                 info_parts.append(f"{description}: {font_type} - {settings.font_name}")
             
-            # Convert to Qt format
-            rgb_img = cv2.cvtColor(preview_img, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_img.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_img.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # Enhanced scaling and display
-            pixmap = QPixmap.fromImage(qt_image)
-            scaled_pixmap = pixmap.scaled(
-                self.preview_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.preview_label.setPixmap(scaled_pixmap)
+            # Render off the GUI thread; on_preview_rendered shows the result
+            self._preview_generation += 1
+            self.preview_render_requested.emit(self._preview_generation, preview_width, preview_height, jobs)
             
             # Enhanced info display
-            current = self.get_current_settings()
-            
             if hasattr(current, '_pillow_font') and current._pillow_font is not None:
                 quality_info = "Highest Quality (Pillow TrueType)"
             elif current.is_freetype_available():
@@ -1263,23 +1437,24 @@ class OpenCVFontSelectionDialog(QDialog):
             else:
                 quality_info = "Standard Quality (OpenCV)"
             
-            info_text = f"""🎯 Current Element: {self.element_combo.currentText()}
-🎨 Font: {current.font_name}
-🔧 Type: {quality_info}
-📏 Size: {current.size} | 🖊️ Thickness: {current.thickness}
-💪 Bold: {current.bold} | 📐 Italic: {current.italic} | 🔲 Border: {current.border_thickness}
-
-📊 Font Capabilities:
-   • TrueType Support: {'✅ Pillow available' if PILLOW_AVAILABLE else '✅ FreeType available' if FREETYPE_AVAILABLE else '❌ Not available'}
-   • Anti-Aliasing: ✅ Enabled
-   • Unicode Support: {'✅ Available' if PILLOW_AVAILABLE else '⚠️ Limited'}
-
-📝 All Font Elements:
-{chr(10).join(f"   • {info}" for info in info_parts)}
-
-💡 Tip: TrueType fonts offer superior quality and smoother rendering!"""
+            info_text = _PREVIEW_INFO_TEMPLATE.format(
+                element=self.element_combo.currentText(),
+                font_name=current.font_name,
+                quality_info=quality_info,
+                size=current.size,
+                thickness=current.thickness,
+                bold=current.bold,
+                italic=current.italic,
+                border=current.border_thickness,
+                elements="\n".join(f"   • {info}" for info in info_parts)
+            )
             
-            self.preview_info.setPlainText(info_text)
+            # Avoid a QTextEdit relayout when nothing changed
+            if info_text != self._last_info_text:
+                self.preview_info.setPlainText(info_text)
+                self._last_info_text = info_text
+            
+            self._last_preview_key = preview_key
             
         except Exception as e:
             self.preview_label.setText(f"❌ Preview Error: {str(e)}")
@@ -1287,6 +1462,38 @@ class OpenCVFontSelectionDialog(QDialog):
             import traceback
             traceback.print_exc()
     
+    def on_preview_rendered(self, generation, qt_image):
+        """Show a preview rendered by the worker (stale results are dropped)"""
+        if generation != self._preview_generation:
+            return
+        # Enhanced display - the canvas normally matches the label, scale only if not
+        pixmap = QPixmap.fromImage(qt_image)
+        label_size = self.preview_label.contentsRect().size()
+        if pixmap.size() != label_size:
+            pixmap = pixmap.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+        self.preview_label.setPixmap(pixmap)
+    
+    def on_preview_failed(self, generation, error_msg):
+        """Show a preview error reported by the worker"""
+        if generation != self._preview_generation:
+            return
+        self._last_preview_key = None
+        self.preview_label.setText(f"❌ Preview Error: {error_msg}")
+    
+    def done(self, result):
+        """Stop the preview worker thread before the dialog closes"""
+        self.preview_timer.stop()
+        self._preview_thread.quit()
+        self._preview_thread.wait()
+        super().done(result)
+    
+    def resizeEvent(self, event):
+        """Re-render the preview at the new label size"""
+        super().resizeEvent(event)
+        if self.main_widget.isVisible():
+            self.schedule_preview_update()
+    
     def reset_to_defaults(self):
         """Reset to improved default settings"""
         # Set reasonable defaults
@@ -1307,12 +1514,154 @@ class OpenCVFontSelectionDialog(QDialog):
     
     def get_selected_settings(self):
         """Get final selected settings"""
+        self.flush_font_changes()
         return self.fps_settings, self.framerate_settings, self.frametime_settings
 
 # ===============================================
 # 🎨 ENHANCED FONT PREVIEW DIALOG
 # ===============================================
 
+# Fallback preview background (gradient + 80px grid), JIT-compiled when Numba is installed
+_FALLBACK_GRID_SPACING = 80
+
+def _fill_fallback_background_numpy(out):
+    """Fill out (H, W, 3) uint8 with the fallback gradient and grid"""
+    height = out.shape[0]
+    # Linear ramp 15 -> 40 over the rows (floor of 15 + 25 * y / height)
+    intensity = np.linspace(15, 40, height, endpoint=False, dtype=np.uint8)
+    blue_tint = np.clip(intensity.astype(np.int16) + 8, 0, 255).astype(np.uint8)
+    out[..., :2] = intensity[:, None, None]
+    out[..., 2] = blue_tint[:, None]
+    
+    # Grid pattern
+    out[:, ::_FALLBACK_GRID_SPACING] = 25
+    out[::_FALLBACK_GRID_SPACING, :] = 25
+    return out
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _fill_fallback_background(out):
+        """Fill out (H, W, 3) uint8 with the fallback gradient and grid"""
+        height, width = out.shape[0], out.shape[1]
+        for y in prange(height):
+            intensity = 15 + y * 25 // height
+            blue_tint = min(255, intensity + 8)
+            grid_row = y % _FALLBACK_GRID_SPACING == 0
+            for x in range(width):
+                if grid_row or x % _FALLBACK_GRID_SPACING == 0:
+                    out[y, x, 0] = 25
+                    out[y, x, 1] = 25
+                    out[y, x, 2] = 25
+                else:
+                    out[y, x, 0] = intensity
+                    out[y, x, 1] = intensity
+                    out[y, x, 2] = blue_tint
+        return out
+else:
+    _fill_fallback_background = _fill_fallback_background_numpy
+
+# Font attributes that affect rendered output, used for preview change detection
+_FONT_SIGNATURE_FIELDS = ('font_path', 'font_name', 'size', 'thickness', 'bold', 'italic',
+                          'border_thickness', 'border_color', 'text_color')
+
+def _font_signature(settings):
+    """Hashable tuple of the rendering-relevant attributes of a font settings object"""
+    signature = []
+    for field in _FONT_SIGNATURE_FIELDS:
+        value = getattr(settings, field, None)
+        # Colors loaded from JSON settings arrive as lists
+        if isinstance(value, list):
+            value = tuple(value)
+        signature.append(value)
+    return tuple(signature)
+
+# Overlay renderer entry points, resolved once on first use.
+# Not done at import time because enhanced_overlay_renderer imports this module.
+_overlay_renderers = None
+
+def _get_overlay_renderers():
+    """Resolve (layout, legacy position, fallback) overlay renderer functions once"""
+    global _overlay_renderers
+    if _overlay_renderers is None:
+        layout_fn = legacy_position_fn = fallback_fn = None
+        try:
+            from freetype_overlay_renderer import (
+                draw_fps_overlay_with_layout as layout_fn,
+                draw_fps_overlay_with_legacy_position as legacy_position_fn
+            )
+            debug_log("🎨 Using Enhanced FreeType Renderer")
+        except ImportError:
+            try:
+                from enhanced_overlay_renderer import (
+                    draw_fps_overlay_with_layout as layout_fn,
+                    draw_fps_overlay_with_legacy_position as legacy_position_fn
+                )
+                debug_log("🎨 Using Enhanced Overlay Renderer")
+            except ImportError:
+                debug_log("⚠️ Enhanced overlay renderer not available")
+        
+        try:
+            from overlay_renderer import draw_fps_overlay as fallback_fn
+        except ImportError:
+            pass
+        
+        _overlay_renderers = (layout_fn, legacy_position_fn, fallback_fn)
+    return _overlay_renderers
+
+
+# Single stylesheet for FontPreviewDialog, widgets pick their rules via objectName
+_COMPILED_STYLE = """
+    QLabel#PreviewHeader {
+        font-weight: bold; color: #4CAF50; padding: 15px; font-size: 16px;
+        background-color: #2a2a2a; border-radius: 8px; border: 2px solid #4CAF50;
+    }
+    QLabel#PreviewCanvas {
+        border: 3px solid #555; background-color: #1a1a1a; border-radius: 10px;
+    }
+    QFrame#BgFrame {
+        background-color: #2f2f2f; border: 2px solid #2196F3;
+        border-radius: 8px; padding: 10px;
+    }
+    QFrame#FrameFrame {
+        background-color: #2f2f2f; border: 2px solid #FF9800;
+        border-radius: 8px; padding: 10px;
+    }
+    QLabel#BgLabel { color: #2196F3; font-weight: bold; font-size: 12px; }
+    QComboBox#BgCombo {
+        padding: 8px; border: 2px solid #555; border-radius: 6px;
+        background-color: #3c3c3c; color: #ffffff; font-size: 12px;
+    }
+    QComboBox#BgCombo:focus { border-color: #2196F3; }
+    QCheckBox#FrameCheck {
+        color: #FF9800; font-weight: bold; font-size: 12px;
+    }
+    QCheckBox#FrameCheck::indicator {
+        width: 16px; height: 16px; border: 2px solid #FF9800;
+        border-radius: 3px; background-color: #3c3c3c;
+    }
+    QCheckBox#FrameCheck::indicator:checked {
+        background-color: #FF9800; border-color: #FF9800;
+    }
+    QPushButton#AccentGreen, QPushButton#AccentBlue, QPushButton#AccentOrange,
+    QPushButton#AccentPurple, QPushButton#AccentSlate {
+        color: white; border: none; border-radius: 8px;
+        padding: 12px 20px; font-weight: bold; font-size: 13px;
+    }
+    QPushButton#AccentGreen { background-color: #4CAF50; }
+    QPushButton#AccentGreen:hover { background-color: #45a049; }
+    QPushButton#AccentBlue { background-color: #2196F3; }
+    QPushButton#AccentBlue:hover { background-color: #1976D2; }
+    QPushButton#AccentOrange { background-color: #FF9800; }
+    QPushButton#AccentOrange:hover { background-color: #F57C00; }
+    QPushButton#AccentPurple { background-color: #9C27B0; }
+    QPushButton#AccentPurple:hover { background-color: #7B1FA2; }
+    QPushButton#AccentSlate {
+        background-color: #607D8B; padding: 12px 24px; font-size: 14px;
+    }
+    QPushButton#AccentSlate:hover { background-color: #546E7A; }
+"""
+
+
 class FontPreviewDialog(QDialog):
     """Enhanced font preview dialog with TrueType support"""
     
@@ -1335,15 +1684,23 @@ class FontPreviewDialog(QDialog):
         
         self.current_background = "Dark Gradient"
         
-        # Enhanced mock data
-        self.mock_fps_history = [60.0, 59.8, 60.1, 58.9, 60.0, 59.7, 60.2, 59.5, 60.0] * 25
-        self.mock_frame_times = [16.7, 16.8, 16.6, 17.0, 16.7, 16.9, 16.5, 17.2, 16.7] * 25
+        # Enhanced mock data (built once, reused by every preview render)
+        self.mock_fps_history = np.tile(np.array(
+            [60.0, 59.8, 60.1, 58.9, 60.0, 59.7, 60.2, 59.5, 60.0], dtype=np.float32), 25)
+        self.mock_frame_times = np.tile(np.array(
+            [16.7, 16.8, 16.6, 17.0, 16.7, 16.9, 16.5, 17.2, 16.7], dtype=np.float32), 25)
         self.mock_current_fps = 59.8
         
-        # Enhanced update timer
+        # Enhanced update timer (started by showEvent, after the initial render,
+        # and paused while the dialog is hidden)
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_preview)
-        self.update_timer.start(2500)  # Slower updates for stability
+        self.update_timer.timeout.connect(self.on_update_timer)
+        
+        # Coalesces bursts of forced updates into one render
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(50)
+        self._coalesce_timer.timeout.connect(self._do_forced_update)
         
         # Performance cache
         self.last_font_hash = None
@@ -1351,6 +1708,9 @@ class FontPreviewDialog(QDialog):
         self.last_background = None
         self.last_window_size = None
         self.cached_preview = None
+        self._bg_cache = {}
+        self._scaled_buf = None
+        self._text_layer_cache = {}
         
         self.setup_enhanced_ui()
         self.update_preview()
@@ -1364,22 +1724,13 @@ class FontPreviewDialog(QDialog):
         # Enhanced header
         renderer_info = "Pillow TrueType" if PILLOW_AVAILABLE else "OpenCV FreeType" if FREETYPE_AVAILABLE else "Standard OpenCV"
         info_label = QLabel(f"🎨 Enhanced Font Preview - {renderer_info} Renderer - Live TrueType Rendering!")
-        info_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold; color: #4CAF50; padding: 15px; font-size: 16px;
-                background-color: #2a2a2a; border-radius: 8px; border: 2px solid #4CAF50;
-            }
-        """)
+        info_label.setObjectName("PreviewHeader")
         layout.addWidget(info_label)
         
         # Enhanced preview area
         self.preview_label = QLabel()
+        self.preview_label.setObjectName("PreviewCanvas")
         self.preview_label.setMinimumSize(1000, 600)
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                border: 3px solid #555; background-color: #1a1a1a; border-radius: 10px;
-            }
-        """)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_label.setScaledContents(False)
         layout.addWidget(self.preview_label, 1)
@@ -1392,32 +1743,21 @@ class FontPreviewDialog(QDialog):
         
         # Enhanced background selector
         bg_frame = QFrame()
-        bg_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2f2f2f; border: 2px solid #2196F3;
-                border-radius: 8px; padding: 10px;
-            }
-        """)
+        bg_frame.setObjectName("BgFrame")
         bg_layout = QHBoxLayout(bg_frame)
         
         bg_label = QLabel("🖼️ Background:")
-        bg_label.setStyleSheet("color: #2196F3; font-weight: bold; font-size: 12px;")
+        bg_label.setObjectName("BgLabel")
         bg_layout.addWidget(bg_label)
         
         self.background_combo = QComboBox()
+        self.background_combo.setObjectName("BgCombo")
         if self.background_manager_available:
             self.background_combo.addItems(self.background_manager.get_available_backgrounds())
         else:
             self.background_combo.addItems(["Dark Gradient", "Light Gradient", "Neutral Gray"])
         self.background_combo.setCurrentText(self.current_background)
         self.background_combo.currentTextChanged.connect(self.change_background)
-        self.background_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px; border: 2px solid #555; border-radius: 6px;
-                background-color: #3c3c3c; color: #ffffff; font-size: 12px;
-            }
-            QComboBox:focus { border-color: #2196F3; }
-        """)
         bg_layout.addWidget(self.background_combo)
         bg_layout.addStretch()
         
@@ -1425,30 +1765,14 @@ class FontPreviewDialog(QDialog):
         
         # Enhanced frame selector
         frame_frame = QFrame()
-        frame_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2f2f2f; border: 2px solid #FF9800;
-                border-radius: 8px; padding: 10px;
-            }
-        """)
+        frame_frame.setObjectName("FrameFrame")
         frame_layout = QHBoxLayout(frame_frame)
         
         self.use_current_frame = QCheckBox("📹 Use current video frame")
+        self.use_current_frame.setObjectName("FrameCheck")
         self.use_current_frame.setChecked(self.current_frame is not None)
         self.use_current_frame.setEnabled(self.current_frame is not None)
         self.use_current_frame.toggled.connect(self.force_update_preview)
-        self.use_current_frame.setStyleSheet("""
-            QCheckBox {
-                color: #FF9800; font-weight: bold; font-size: 12px;
-            }
-            QCheckBox::indicator {
-                width: 16px; height: 16px; border: 2px solid #FF9800;
-                border-radius: 3px; background-color: #3c3c3c;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #FF9800; border-color: #FF9800;
-            }
-        """)
         frame_layout.addWidget(self.use_current_frame)
         frame_layout.addStretch()
         
@@ -1461,74 +1785,46 @@ class FontPreviewDialog(QDialog):
         
         # Font settings button
         font_settings_btn = QPushButton("🔤 Font Settings")
+        font_settings_btn.setObjectName("AccentGreen")
         font_settings_btn.clicked.connect(self.open_font_settings)
-        font_settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50; color: white; border: none;
-                border-radius: 8px; padding: 12px 20px; font-weight: bold; font-size: 13px;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
         button_layout.addWidget(font_settings_btn)
         
         # Color settings button
         color_settings_btn = QPushButton("🎨 Color Settings")
+        color_settings_btn.setObjectName("AccentBlue")
         color_settings_btn.clicked.connect(self.open_color_settings)
-        color_settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3; color: white; border: none;
-                border-radius: 8px; padding: 12px 20px; font-weight: bold; font-size: 13px;
-            }
-            QPushButton:hover { background-color: #1976D2; }
-        """)
         button_layout.addWidget(color_settings_btn)
         
         # Layout editor button
         if hasattr(self.parent_analyzer, 'open_layout_editor'):
             layout_editor_btn = QPushButton("🎯 Layout Editor")
+            layout_editor_btn.setObjectName("AccentOrange")
             layout_editor_btn.clicked.connect(self.open_layout_editor)
-            layout_editor_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF9800; color: white; border: none;
-                    border-radius: 8px; padding: 12px 20px; font-weight: bold; font-size: 13px;
-                }
-                QPushButton:hover { background-color: #F57C00; }
-            """)
             button_layout.addWidget(layout_editor_btn)
         
         # Manual refresh button
         refresh_btn = QPushButton("🔄 Refresh Preview")
+        refresh_btn.setObjectName("AccentPurple")
         refresh_btn.clicked.connect(self.force_update_preview)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9C27B0; color: white; border: none;
-                border-radius: 8px; padding: 12px 20px; font-weight: bold; font-size: 13px;
-            }
-            QPushButton:hover { background-color: #7B1FA2; }
-        """)
         button_layout.addWidget(refresh_btn)
         
         button_layout.addStretch()
         
         # Close button
         close_btn = QPushButton("✓ Close Preview")
+        close_btn.setObjectName("AccentSlate")
         close_btn.clicked.connect(self.accept)
         close_btn.setDefault(True)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #607D8B; color: white; border: none;
-                border-radius: 8px; padding: 12px 24px; font-weight: bold; font-size: 14px;
-            }
-            QPushButton:hover { background-color: #546E7A; }
-        """)
         button_layout.addWidget(close_btn)
         
         controls_layout.addLayout(button_layout)
         layout.addLayout(controls_layout)
         
-        # Apply parent theme
+        # Apply parent theme plus the dialog's own rules in one sheet
         if hasattr(self.parent_analyzer, 'current_theme'):
-            self.setStyleSheet(self.parent_analyzer.styleSheet())
+            self.setStyleSheet(self.parent_analyzer.styleSheet() + _COMPILED_STYLE)
+        else:
+            self.setStyleSheet(_COMPILED_STYLE)
     
     def change_background(self, background_name):
         """Change preview background"""
@@ -1537,35 +1833,32 @@ class FontPreviewDialog(QDialog):
         self.force_update_preview()
     
     def get_preview_frame(self):
-        """Get enhanced frame for preview"""
+        """Get enhanced frame for preview
+        
+        Procedural backgrounds are cached and returned as read-only arrays;
+        callers must not draw into them directly.
+        """
         if self.use_current_frame.isChecked() and self.current_frame is not None:
             return self.current_frame.copy()
+        
+        cache_key = (self.current_background, bool(self.background_manager_available))
+        background = self._bg_cache.get(cache_key)
+        if background is None:
+            background = self.create_preview_background()
+            background.setflags(write=False)
+            self._bg_cache[cache_key] = background
+        return background
+    
+    def create_preview_background(self):
+        """Build the procedural preview background"""
+        if self.background_manager_available:
+            # Background plus enhanced UI elements in one buffer
+            return self.background_manager.create_background_with_ui(
+                self.current_background, 1920, 1080
+            )
         else:
-            # Create enhanced background
-            if self.background_manager_available:
-                background = self.background_manager.create_background(
-                    self.current_background, 1920, 1080
-                )
-                # Add enhanced UI elements
-                background = self.background_manager.add_simple_ui_elements(background)
-                return background
-            else:
-                # Simple fallback background
-                background = np.zeros((1080, 1920, 3), dtype=np.uint8)
-                # Gradient background
-                for y in range(1080):
-                    intensity = int(15 + (y / 1080) * 25)
-                    blue_tint = min(255, intensity + 8)
-                    background[y, :] = [intensity, intensity, blue_tint]
-                
-                # Add grid pattern
-                grid_spacing = 80
-                for i in range(0, 1920, grid_spacing):
-                    cv2.line(background, (i, 0), (i, 1080), (25, 25, 25), 1)
-                for i in range(0, 1080, grid_spacing):
-                    cv2.line(background, (0, i), (1920, i), (25, 25, 25), 1)
-                    
-                return background
+            # Simple fallback background: gradient with grid pattern
+            return _fill_fallback_background(np.empty((1080, 1920, 3), dtype=np.uint8))
     
     def update_preview(self):
         """Update preview with performance optimization"""
@@ -1584,8 +1877,8 @@ class FontPreviewDialog(QDialog):
             
             # Performance optimization checks
             current_size = self.size()
-            current_font_hash = hash(str(font_settings))
-            current_color_hash = hash(str(color_settings))
+            current_font_hash = hash(tuple(_font_signature(settings) for settings in font_settings.values()))
+            current_color_hash = hash((color_settings['framerate_color'], color_settings['frametime_color']))
             
             settings_changed = (
                 self.last_font_hash != current_font_hash or 
@@ -1595,7 +1888,9 @@ class FontPreviewDialog(QDialog):
             
             size_changed = self.last_window_size != current_size
             
-            # Skip expensive update if nothing changed
+            # Skip expensive update if nothing changed. The animated FPS is
+            # sampled only when a render happens, so timer ticks with unchanged
+            # settings, size and background never reach the overlay renderer.
             if not settings_changed and not size_changed and self.cached_preview is not None:
                 return
             
@@ -1609,7 +1904,8 @@ class FontPreviewDialog(QDialog):
             
             # Get base frame
             frame = self.get_preview_frame()
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Zero-copy channel swap; renderers copy the frame before drawing
+            frame_rgb = frame[..., ::-1]
             
             # Get frametime scale
             if hasattr(self.parent_analyzer, 'frametime_scale_combo'):
@@ -1635,20 +1931,18 @@ class FontPreviewDialog(QDialog):
             # Cache result
             self.cached_preview = frame_with_overlay.copy()
             
-            # Convert to Qt and display
-            h, w, ch = frame_with_overlay.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(frame_with_overlay.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+            # Shrink to the label size before handing the frame to Qt
+            frame_with_overlay = self.fit_to_preview_label(frame_with_overlay)
+            
+            # Convert to Qt and display. A 4-byte RGBX buffer has naturally
+            # aligned scanlines and converts to the pixmap format without repacking.
+            frame_rgbx = cv2.cvtColor(frame_with_overlay, cv2.COLOR_RGB2RGBA)
+            h, w = frame_rgbx.shape[:2]
+            qt_image = QImage(frame_rgbx.data, w, h, 4 * w, QImage.Format.Format_RGBX8888)
             
             # Enhanced scaling
-            preview_size = self.preview_label.size()
             pixmap = QPixmap.fromImage(qt_image)
-            scaled_pixmap = pixmap.scaled(
-                preview_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.preview_label.setPixmap(scaled_pixmap)
+            self.preview_label.setPixmap(self.draw_scaled_preview(pixmap))
             
             renderer_type = "Pillow TrueType" if PILLOW_AVAILABLE else "OpenCV FreeType" if FREETYPE_AVAILABLE else "Standard OpenCV"
             debug_log(f"✅ Enhanced Font Preview: Update completed with {renderer_type}!")
@@ -1659,24 +1953,46 @@ class FontPreviewDialog(QDialog):
             traceback.print_exc()
             self.show_error_in_preview(str(e))
     
+    def fit_to_preview_label(self, frame):
+        """Downscale frame to fit the preview label, keeping aspect ratio
+        
+        The overlay is still rendered at full resolution: the overlay renderer
+        scales layout and font sizes non-linearly with frame size, so rendering
+        directly at label size would not match the exported look.
+        """
+        h, w = frame.shape[:2]
+        label_size = self.preview_label.size()
+        scale = min(label_size.width() / w, label_size.height() / h)
+        if scale >= 1.0 or scale <= 0:
+            return frame
+        target_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        return cv2.resize(frame, target_size, interpolation=cv2.INTER_AREA)
+    
+    def draw_scaled_preview(self, pixmap):
+        """Paint pixmap aspect-correct into a reusable label-sized buffer"""
+        label_size = self.preview_label.size()
+        if self._scaled_buf is None or self._scaled_buf.size() != label_size:
+            self._scaled_buf = QPixmap(label_size)
+        self._scaled_buf.fill(Qt.GlobalColor.transparent)
+        
+        target = QRect(QPoint(0, 0), pixmap.size().scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio))
+        target.moveCenter(self._scaled_buf.rect().center())
+        
+        painter = QPainter(self._scaled_buf)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+            painter.drawPixmap(target, pixmap)
+        finally:
+            painter.end()
+        return self._scaled_buf
+    
     def render_overlay_with_available_renderer(self, frame_rgb, animated_fps, frametime_scale, font_settings, color_settings):
         """Render overlay with available renderer"""
+        layout_fn, legacy_position_fn, fallback_fn = _get_overlay_renderers()
+        
         # First try enhanced renderer
-        try:
-            # Import enhanced renderer
+        if layout_fn is not None:
             try:
-                from freetype_overlay_renderer import draw_fps_overlay_with_layout
-                enhanced_available = True
-                debug_log("🎨 Using Enhanced FreeType Renderer")
-            except ImportError:
-                try:
-                    from enhanced_overlay_renderer import draw_fps_overlay_with_layout
-                    enhanced_available = True
-                    debug_log("🎨 Using Enhanced Overlay Renderer")
-                except ImportError:
-                    enhanced_available = False
-            
-            if enhanced_available:
                 # Check for layout manager
                 if hasattr(self.parent_analyzer, 'layout_manager'):
                     layout_config = self.parent_analyzer.layout_manager.convert_to_overlay_positions(
@@ -1684,7 +2000,7 @@ class FontPreviewDialog(QDialog):
                         1920, 1080
                     )
                     debug_log("🎨 Using Enhanced Renderer with custom layout")
-                    return draw_fps_overlay_with_layout(
+                    return layout_fn(
                         frame_rgb,
                         self.mock_fps_history,
                         animated_fps,
@@ -1700,14 +2016,9 @@ class FontPreviewDialog(QDialog):
                     )
                 else:
                     # Enhanced renderer with legacy position
-                    try:
-                        from freetype_overlay_renderer import draw_fps_overlay_with_legacy_position
-                    except ImportError:
-                        from enhanced_overlay_renderer import draw_fps_overlay_with_legacy_position
-                        
                     ftg_position = getattr(self.parent_analyzer, 'ftg_position', 'bottom_right')
                     debug_log(f"🎨 Using Enhanced Renderer with position: {ftg_position}")
-                    return draw_fps_overlay_with_legacy_position(
+                    return legacy_position_fn(
                         frame_rgb,
                         self.mock_fps_history,
                         animated_fps,
@@ -1721,45 +2032,49 @@ class FontPreviewDialog(QDialog):
                         color_settings,
                         ftg_position
                     )
-        except Exception as e:
-            debug_log(f"❌ Enhanced renderer failed: {e}")
+            except Exception as e:
+                debug_log(f"❌ Enhanced renderer failed: {e}")
         
         # Fallback to legacy renderer
-        try:
-            from overlay_renderer import draw_fps_overlay
-            ftg_position = getattr(self.parent_analyzer, 'ftg_position', 'bottom_right')
-            debug_log(f"🔄 Using Legacy Renderer with position: {ftg_position}")
-            return draw_fps_overlay(
-                frame_rgb,
-                self.mock_fps_history,
-                animated_fps,
-                self.mock_frame_times,
-                True,  # show_frame_time_graph
-                180,   # max_len
-                self.mock_fps_history,  # global_fps_values
-                self.mock_frame_times,  # global_frame_times
-                frametime_scale,
-                font_settings,
-                color_settings,
-                ftg_position
-            )
-        except Exception as e:
-            debug_log(f"❌ Legacy renderer failed: {e}")
-            return self.create_simple_overlay(frame_rgb, animated_fps)
+        if fallback_fn is not None:
+            try:
+                ftg_position = getattr(self.parent_analyzer, 'ftg_position', 'bottom_right')
+                debug_log(f"🔄 Using Legacy Renderer with position: {ftg_position}")
+                return fallback_fn(
+                    frame_rgb,
+                    self.mock_fps_history,
+                    animated_fps,
+                    self.mock_frame_times,
+                    True,  # show_frame_time_graph
+                    180,   # max_len
+                    self.mock_fps_history,  # global_fps_values
+                    self.mock_frame_times,  # global_frame_times
+                    frametime_scale,
+                    font_settings,
+                    color_settings,
+                    ftg_position
+                )
+            except Exception as e:
+                debug_log(f"❌ Legacy renderer failed: {e}")
+        else:
+            debug_log("❌ Legacy renderer not available")
+        
+        return self.create_simple_overlay(frame_rgb, animated_fps)
     
     def create_simple_overlay(self, frame_rgb, fps_value):
         """Create simple overlay when renderers fail"""
         overlay = frame_rgb.copy()
         
+        # Constant lines come from a cached pre-rendered layer
+        font_renderer = "Pillow TrueType" if PILLOW_AVAILABLE else "OpenCV FreeType" if FREETYPE_AVAILABLE else "Standard OpenCV"
+        self.blend_static_text(overlay, 'simple', (
+            ("Enhanced Font Preview Mode", (50, 140), 1.2, (255, 255, 0), 3),
+            (f"Font Renderer: {font_renderer}", (50, 180), 0.8, (255, 255, 255), 2),
+        ))
+        
         # Simple FPS text with improved styling
         cv2.putText(overlay, f"FPS: {fps_value:.1f}", (50, 80), 
                    cv2.FONT_HERSHEY_SIMPLEX, 2.5, (0, 255, 0), 4, cv2.LINE_AA)
-        cv2.putText(overlay, "Enhanced Font Preview Mode", (50, 140), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 0), 3, cv2.LINE_AA)
-        
-        font_renderer = "Pillow TrueType" if PILLOW_AVAILABLE else "OpenCV FreeType" if FREETYPE_AVAILABLE else "Standard OpenCV"
-        cv2.putText(overlay, f"Font Renderer: {font_renderer}", (50, 180), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
         
         return overlay
     
@@ -1767,15 +2082,52 @@ class FontPreviewDialog(QDialog):
         """Create error overlay with improved styling"""
         overlay = frame_rgb.copy()
         
-        cv2.putText(overlay, "ENHANCED OVERLAY ERROR", (50, 80), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.8, (0, 0, 255), 4, cv2.LINE_AA)
+        self.blend_static_text(overlay, 'error', (
+            ("ENHANCED OVERLAY ERROR", (50, 80), 1.8, (0, 0, 255), 4),
+            ("Check console for details", (50, 180), 0.6, (200, 200, 200), 2),
+        ))
         cv2.putText(overlay, f"Error: {error_msg[:60]}...", (50, 140), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2, cv2.LINE_AA)
-        cv2.putText(overlay, "Check console for details", (50, 180), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 2, cv2.LINE_AA)
         
         return overlay
     
+    def blend_static_text(self, overlay, layer_name, text_items):
+        """Blend constant text into overlay from a cached pre-rendered layer
+        
+        text_items is a sequence of (text, position, font_scale, color, thickness).
+        The layer is rasterized once per frame size and cropped to its bounding box.
+        """
+        cache_key = (layer_name, overlay.shape)
+        layer = self._text_layer_cache.get(cache_key)
+        if layer is None:
+            h, w = overlay.shape[:2]
+            color = np.zeros((h, w, 3), dtype=np.uint8)
+            alpha = np.zeros((h, w), dtype=np.uint8)
+            for text, position, font_scale, text_color, thickness in text_items:
+                # Anti-aliased text on black gives colors premultiplied by coverage
+                cv2.putText(color, text, position, cv2.FONT_HERSHEY_SIMPLEX,
+                           font_scale, text_color, thickness, cv2.LINE_AA)
+                cv2.putText(alpha, text, position, cv2.FONT_HERSHEY_SIMPLEX,
+                           font_scale, 255, thickness, cv2.LINE_AA)
+            
+            ys, xs = np.nonzero(alpha)
+            if len(ys) == 0:
+                layer = False
+            else:
+                y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+                layer = (y0, y1, x0, x1,
+                         color[y0:y1, x0:x1].astype(np.float32),
+                         1.0 - alpha[y0:y1, x0:x1, None].astype(np.float32) / 255.0)
+            self._text_layer_cache[cache_key] = layer
+        
+        if layer is False:
+            return overlay
+        
+        y0, y1, x0, x1, color, inv_alpha = layer
+        roi = overlay[y0:y1, x0:x1]
+        roi[:] = np.clip(roi * inv_alpha + color, 0, 255).astype(np.uint8)
+        return overlay
+    
     def show_error_in_preview(self, error_msg):
         """Show error in preview area"""
         error_pixmap = QPixmap(800, 600)
@@ -1802,6 +2154,14 @@ class FontPreviewDialog(QDialog):
             debug_log("⚠️ Layout Editor not available in parent")
     
     def force_update_preview(self):
+        """Request a forced preview update
+        
+        Bursts of requests (e.g. clicking through several options) collapse
+        into a single render once the coalesce timer expires.
+        """
+        self._coalesce_timer.start()
+    
+    def _do_forced_update(self):
         """Force immediate preview update"""
         # Clear cache to force update
         self.last_font_hash = None
@@ -1813,9 +2173,27 @@ class FontPreviewDialog(QDialog):
         debug_log("🔄 Enhanced Font Preview: Forced update triggered")
         self.update_preview()
     
+    def on_update_timer(self):
+        """Periodic preview refresh - skipped while nothing is on screen"""
+        if not self.isVisible() or self.isMinimized():
+            return
+        self.update_preview()
+    
+    def showEvent(self, event):
+        """Resume periodic updates when the dialog is shown"""
+        if not self.update_timer.isActive():
+            self.update_timer.start(2500)
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Pause periodic updates while the dialog is hidden"""
+        self.update_timer.stop()
+        super().hideEvent(event)
+    
     def closeEvent(self, event):
         """Handle dialog close"""
         self.update_timer.stop()
+        self._coalesce_timer.stop()
         event.accept()
 
 
@@ -1823,10 +2201,24 @@ class FontPreviewDialog(QDialog):
 # 📊 ENHANCED FONT MANAGER
 # ===============================================
 
+# On-disk cache of discovered fonts; bump the version when the format changes
+_FONT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "fps_analyzer", "fonts.json")
+_FONT_CACHE_VERSION = 2
+
 class EnhancedFontManager:
     """Enhanced font manager with complete system integration"""
     
     def __init__(self):
+        print("🚀 Enhanced Font Manager - TrueType Integration initialized!")
+        if PILLOW_AVAILABLE:
+            print(f"   • TrueType Support: ✅ Available (Pillow)")
+        elif FREETYPE_AVAILABLE:
+            print(f"   • TrueType Support: ✅ Available (OpenCV FreeType)")
+        else:
+            print(f"   • TrueType Support: ❌ Not available (Standard OpenCV)")
+        print(f"   • System Font Discovery: ✅ Active")
+        print(f"   • Backward Compatibility: ✅ 100%")
+        
         self.font_discovery = SystemFontDiscovery()
         self.font_cache = {}
         self.available_fonts = []
@@ -1836,9 +2228,62 @@ class EnhancedFontManager:
     
     def discover_fonts(self):
         """Discover available system fonts"""
+        sig = self._font_dirs_signature()
+        cached_fonts = self._load_font_cache(sig)
+        if cached_fonts is not None:
+            self.font_discovery.set_fonts(cached_fonts)
+            self.available_fonts = self.font_discovery.system_fonts
+            debug_log(f"Loaded {len(self.available_fonts)} fonts from cache")
+            return
+        
         debug_log("Starting enhanced font discovery...")
         self.available_fonts = self.font_discovery.discover_fonts()
         debug_log(f"Enhanced font discovery completed - {len(self.available_fonts)} fonts found")
+        self._save_font_cache(sig, self.available_fonts)
+    
+    def _font_dirs_signature(self) -> str:
+        """Hash of the platform and the mtime of every font (sub)directory
+        
+        Discovery globs recursively, and adding or removing a font only touches
+        the mtime of the directory that holds it, so every level is stat'ed.
+        Walking the directories is still far cheaper than re-globbing the fonts.
+        """
+        digest = hashlib.sha1(platform.system().encode('utf-8'))
+        for font_dir in getattr(self.font_discovery, 'font_dirs', []):
+            if not os.path.isdir(font_dir):
+                continue
+            for dirpath, dirnames, _filenames in os.walk(font_dir):
+                dirnames.sort()
+                try:
+                    mtime = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    continue
+                digest.update(f"{dirpath}\0{mtime}\n".encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+    
+    def _load_font_cache(self, sig: str) -> Optional[List[Dict]]:
+        """Return cached fonts if the cache matches the current signature"""
+        try:
+            with open(_FONT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            version, cached_sig, fonts = cache['version'], cache['signature'], cache['fonts']
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        
+        if version != _FONT_CACHE_VERSION or cached_sig != sig or not fonts:
+            return None
+        return fonts
+    
+    def _save_font_cache(self, sig: str, fonts: List[Dict]):
+        """Write discovered fonts to the on-disk cache"""
+        if not fonts:
+            return
+        try:
+            os.makedirs(os.path.dirname(_FONT_CACHE_FILE), exist_ok=True)
+            with open(_FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'version': _FONT_CACHE_VERSION, 'signature': sig, 'fonts': fonts}, f)
+        except (OSError, TypeError, ValueError) as e:
+            debug_log(f"Could not write font cache: {e}")
     
     def get_font_by_name(self, name: str) -> Optional[Dict]:
         """Get font info by name"""
@@ -1869,21 +2314,19 @@ class EnhancedFontManager:
 # 🎯 GLOBAL INITIALIZATION
 # ===============================================
 
-# Initialize global font manager
-print("🚀 Enhanced Font Manager - TrueType Integration initialized!")
-if PILLOW_AVAILABLE:
-    print(f"   • TrueType Support: ✅ Available (Pillow)")
-elif FREETYPE_AVAILABLE:
-    print(f"   • TrueType Support: ✅ Available (OpenCV FreeType)")
-else:
-    print(f"   • TrueType Support: ❌ Not available (Standard OpenCV)")
-print(f"   • System Font Discovery: ✅ Active")
-print(f"   • Backward Compatibility: ✅ 100%")
-
-_global_font_manager = EnhancedFontManager()
+# Global font manager, created on first use so importing this module
+# does not trigger a system font scan. The lock covers FontDiscoveryThread
+# racing the GUI thread for the first call.
+_global_font_manager = None
+_global_font_manager_lock = threading.Lock()
 
 def get_font_manager() -> EnhancedFontManager:
     """Get global font manager instance"""
+    global _global_font_manager
+    if _global_font_manager is None:
+        with _global_font_manager_lock:
+            if _global_font_manager is None:
+                _global_font_manager = EnhancedFontManager()
     return _global_font_manager
 
 # ===============================================
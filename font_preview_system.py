@@ -6,6 +6,10 @@ Live preview of font settings with selectable backgrounds and working updates
 
 """
 
+import math
+
+import time
+
 import cv2
 
 import numpy as np
@@ -20,6 +24,35 @@ from overlay_renderer import draw_fps_overlay
 
 from background_manager import BackgroundManager
 
+# Debug output for the preview's per-update messages (off by default)
+_DEBUG_MODE = False
+
+def debug_log(message):
+
+    if _DEBUG_MODE:
+
+        print(f"[PREVIEW DEBUG] {message}")
+
+def _freeze(value):
+
+    """Build a hashable structural snapshot of nested settings (no str()/repr round-trip)"""
+
+    if isinstance(value, dict):
+
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+
+        return tuple(_freeze(item) for item in value)
+
+    if hasattr(value, 'to_dict'):
+
+        # Font settings objects: snapshot their fields so in-place edits are detected
+
+        return _freeze(value.to_dict())
+
+    return value
+
 class FontPreviewDialog(QDialog):
 
     """Dialog for previewing font settings with selectable backgrounds - IMPROVED"""
@@ -44,11 +77,11 @@ class FontPreviewDialog(QDialog):
 
         self.current_background = "Dark Gradient"  # Default
 
-        # Mock data for preview
+        # Mock data for preview (built once as float32 arrays, never mutated by the overlay)
 
-        self.mock_fps_history = [60.0, 59.8, 60.1, 58.9, 60.0, 59.7, 60.2, 59.5, 60.0] * 20
+        self.mock_fps_history = np.tile(np.array([60.0, 59.8, 60.1, 58.9, 60.0, 59.7, 60.2, 59.5, 60.0], dtype=np.float32), 20)
 
-        self.mock_frame_times = [16.7, 16.8, 16.6, 17.0, 16.7, 16.9, 16.5, 17.2, 16.7] * 20
+        self.mock_frame_times = np.tile(np.array([16.7, 16.8, 16.6, 17.0, 16.7, 16.9, 16.5, 17.2, 16.7], dtype=np.float32), 20)
 
         # 🔧 IMPROVED: Stable FPS for preview (no flickering)
 
@@ -60,7 +93,15 @@ class FontPreviewDialog(QDialog):
 
         self.update_timer.timeout.connect(self.update_preview)
 
-        self.update_timer.start(2000)  # Update every 2 seconds instead of 1
+        self.update_timer.setInterval(2000)  # Update every 2 seconds while visible (see showEvent)
+
+        # Coalescing timer - bursts of forced updates collapse into one render after a short quiet period
+
+        self._coalesce_timer = QTimer()
+
+        self._coalesce_timer.setSingleShot(True)
+
+        self._coalesce_timer.timeout.connect(self.update_preview)
 
         # Resize timer
 
@@ -80,12 +121,52 @@ class FontPreviewDialog(QDialog):
 
         self.last_window_size = None
 
-        self.cached_preview = None  # Cache the rendered preview
+        self.cached_preview = None  # Set once a preview has been rendered
+
+        self._bg_cache = {}  # (background name, width, height) -> decorated background
+
+        self._dirty = True  # Set by change sources; idle ticks skip the hash checks
+
+        self._last_frame_buffer = None  # Backing array of the last preview QImage
+
+        # Frametime scale: read once, then follow the parent's combo instead of polling it
+
+        if hasattr(self.parent_analyzer, 'frametime_scale_combo'):
+
+            self._frametime_scale = self.parent_analyzer.frametime_scale_combo.currentData()
+
+            self.parent_analyzer.frametime_scale_combo.currentIndexChanged.connect(self._on_frametime_scale_changed)
+
+        else:
+
+            self._frametime_scale = {'min': 10, 'mid': 35, 'max': 60, 'labels': ['10', '35', '60']}
+
+        # Error placeholder, built once and reused on every failed update
+
+        self._error_pixmap = QPixmap(640, 360)
+
+        self._error_pixmap.fill(Qt.GlobalColor.darkRed)
 
         self.setup_ui()
 
+    def showEvent(self, event):
+
+        """Start live updates only while the preview is on screen"""
+
+        super().showEvent(event)
+
+        self.update_timer.start()
+
         self.update_preview()
 
+    def hideEvent(self, event):
+
+        """Stop live updates while hidden or minimized"""
+
+        super().hideEvent(event)
+
+        self.update_timer.stop()
+
     def setup_ui(self):
 
         layout = QVBoxLayout(self)
@@ -242,67 +323,61 @@ class FontPreviewDialog(QDialog):
 
         self.current_background = background_name
 
-        print(f"🖼️ Background changed to: {background_name}")
+        self._dirty = True
+
+        debug_log(f"🖼️ Background changed to: {background_name}")
 
         self.force_update_preview()
 
     def get_preview_frame(self):
 
-        """Get frame for preview (video frame or selected background)"""
+        """Get RGB frame for preview (video frame or selected background)"""
 
         if self.use_current_frame.isChecked() and self.current_frame is not None:
 
-            # Use actual video frame
+            # Use actual video frame - cvtColor allocates the RGB output, so the source is never drawn on
 
-            return self.current_frame.copy()
+            return cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
 
         else:
 
-            # Create selected background
+            # Backgrounds don't depend on font/color settings - build once per (name, size)
 
-            background = self.background_manager.create_background(
+            key = (self.current_background, 1920, 1080)
 
-                self.current_background, 1920, 1080
+            background = self._bg_cache.get(key)
 
-            )
-
-            # Add simple UI elements for context
-
-            background = self.background_manager.add_simple_ui_elements(background)
+            if background is None:
 
-            return background
+                # Create selected background with UI elements directly in RGB order (no conversion pass)
 
-    def draw_text_with_smooth_border(self, img, text, position, font, font_scale, color, thickness, border_color=(0, 0, 0), border_thickness=2):
+                background = self.background_manager.create_background_with_ui(
 
-        """🎨 IMPROVED: Draw text with better anti-aliasing"""
+                    self.current_background, 1920, 1080, color_order='RGB'
 
-        x, y = position
+                )
 
-        # Use LINE_AA for smooth anti-aliased rendering
+                self._bg_cache[key] = background
 
-        line_type = cv2.LINE_AA
+            # The overlay draws in place, so hand out a copy
 
-        # Draw border with multiple passes for smoother effect
+            return background.copy()
 
-        for offset in range(border_thickness, 0, -1):
-
-            for dx in [-offset, 0, offset]:
-
-                for dy in [-offset, 0, offset]:
+    def update_preview(self):
 
-                    if dx != 0 or dy != 0:
+        """Update the font preview with IMPROVED performance and stability"""
 
-                        cv2.putText(img, text, (x + dx, y + dy), font, font_scale, 
+        # Nothing to draw while the dialog is hidden or minimized
 
-                                   border_color, thickness + offset, lineType=line_type)
+        if not self.isVisible() or self.isMinimized():
 
-        # Draw main text with anti-aliasing
+            return
 
-        cv2.putText(img, text, position, font, font_scale, color, thickness, lineType=line_type)
+        # Cheap early-out: idle ticks stay no-ops, the FPS only animates on real re-renders
 
-    def update_preview(self):
+        if not self._dirty and self.cached_preview is not None:
 
-        """Update the font preview with IMPROVED performance and stability"""
+            return
 
         try:
 
@@ -332,9 +407,9 @@ class FontPreviewDialog(QDialog):
 
             # Create hash of current settings
 
-            current_font_hash = hash(str(font_settings))
+            current_font_hash = hash(_freeze(font_settings))
 
-            current_color_hash = hash(str(color_settings))
+            current_color_hash = hash(_freeze(color_settings))
 
             # 🔧 IMPROVED: More selective update checking
 
@@ -354,6 +429,8 @@ class FontPreviewDialog(QDialog):
 
             if not settings_changed and not size_changed and self.cached_preview is not None:
 
+                self._dirty = False
+
                 return  # No changes, skip expensive update
 
             # Store current hashes and settings
@@ -366,37 +443,25 @@ class FontPreviewDialog(QDialog):
 
             self.last_window_size = current_size
 
-            print(f"🔄 Font Preview: Updating with background: {self.current_background}")
-
-            # Get base frame (now with selectable background)
+            debug_log(f"🔄 Font Preview: Updating with background: {self.current_background}")
 
-            frame = self.get_preview_frame()
-
-            # Convert to RGB for overlay processing
-
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Get frametime scale setting
-
-            if hasattr(self.parent_analyzer, 'frametime_scale_combo'):
-
-                frametime_scale = self.parent_analyzer.frametime_scale_combo.currentData()
+            # 🔧 IMPROVED: Create smooth animated FPS for better preview
 
-            else:
+            # Vary FPS slightly for more realistic preview
 
-                frametime_scale = {'min': 10, 'mid': 35, 'max': 60, 'labels': ['10', '35', '60']}
+            time_factor = time.time() % 10  # 10-second cycle
 
-            # 🔧 IMPROVED: Create smooth animated FPS for better preview
+            fps_variation = 1.5 * math.sin(time_factor * 0.6)  # Smooth sine wave
 
-            # Vary FPS slightly for more realistic preview
+            animated_fps = round(59.8 + fps_variation, 1)  # 58.3 to 61.3 range, at display precision
 
-            import time
+            # Get base RGB frame (now with selectable background)
 
-            time_factor = time.time() % 10  # 10-second cycle
+            frame_rgb = self.get_preview_frame()
 
-            fps_variation = 1.5 * np.sin(time_factor * 0.6)  # Smooth sine wave
+            # Frametime scale setting (kept current by the parent's combo signal)
 
-            animated_fps = 59.8 + fps_variation  # 58.3 to 61.3 range
+            frametime_scale = self._frametime_scale
 
             # Apply overlay with current settings and STABLE animated FPS
 
@@ -428,37 +493,37 @@ class FontPreviewDialog(QDialog):
 
             )
 
-            # Cache the preview
+            # Mark the preview as rendered (only gates the early return, so no frame copy)
 
-            self.cached_preview = frame_with_overlay.copy()
+            self.cached_preview = True
 
-            # Convert to Qt format and display
+            self._dirty = False
 
-            h, w, ch = frame_with_overlay.shape
+            # Downscale to fit the preview area (aspect-preserving) before handing it to Qt
 
-            bytes_per_line = ch * w
+            h, w, ch = frame_with_overlay.shape
 
-            qt_image = QImage(frame_with_overlay.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+            preview_size = self.preview_label.size()
 
-            # Scale to fit preview area with smooth transformation
+            scale = min(preview_size.width() / w, preview_size.height() / h)
 
-            preview_size = self.preview_label.size()
+            target_w = max(1, int(w * scale))
 
-            pixmap = QPixmap.fromImage(qt_image)
+            target_h = max(1, int(h * scale))
 
-            scaled_pixmap = pixmap.scaled(
+            # QImage wraps this buffer without copying - keep it referenced on self so it outlives the image
 
-                preview_size,
+            self._last_frame_buffer = cv2.resize(frame_with_overlay, (target_w, target_h), interpolation=cv2.INTER_AREA)
 
-                Qt.AspectRatioMode.KeepAspectRatio,
+            # Convert to Qt format and display (fromImage makes the only copy, into the small pixmap)
 
-                Qt.TransformationMode.SmoothTransformation  # Smooth scaling
+            bytes_per_line = ch * target_w
 
-            )
+            qt_image = QImage(self._last_frame_buffer.data, target_w, target_h, bytes_per_line, QImage.Format.Format_RGB888)
 
-            self.preview_label.setPixmap(scaled_pixmap)
+            self.preview_label.setPixmap(QPixmap.fromImage(qt_image))
 
-            print(f"✅ Font Preview: Update completed! Background: {self.current_background}")
+            debug_log(f"✅ Font Preview: Update completed! Background: {self.current_background}")
 
         except Exception as e:
 
@@ -470,13 +535,19 @@ class FontPreviewDialog(QDialog):
 
             # Show error in preview
 
-            error_pixmap = QPixmap(640, 360)
+            self.preview_label.setPixmap(self._error_pixmap)
 
-            error_pixmap.fill(Qt.GlobalColor.darkRed)
+            self.preview_label.setText(f"Preview Error: {str(e)}")
 
-            self.preview_label.setPixmap(error_pixmap)
+    def _on_frametime_scale_changed(self, index):
 
-            self.preview_label.setText(f"Preview Error: {str(e)}")
+        """Cache the parent's new frametime scale and redraw"""
+
+        self._frametime_scale = self.parent_analyzer.frametime_scale_combo.currentData()
+
+        self._dirty = True
+
+        self.cached_preview = None
 
     def open_font_settings(self):
 
@@ -504,8 +575,22 @@ class FontPreviewDialog(QDialog):
 
         self.update_timer.stop()
 
+        self._coalesce_timer.stop()
+
         self.resize_timer.stop()
 
+        # Drop the connection to the parent's combo, which outlives this dialog
+
+        if hasattr(self.parent_analyzer, 'frametime_scale_combo'):
+
+            try:
+
+                self.parent_analyzer.frametime_scale_combo.currentIndexChanged.disconnect(self._on_frametime_scale_changed)
+
+            except TypeError:
+
+                pass  # Already disconnected
+
         event.accept()
 
     def resizeEvent(self, event):
@@ -522,11 +607,13 @@ class FontPreviewDialog(QDialog):
 
         """Called when user has finished resizing the window"""
 
+        self._dirty = True
+
         current_size = self.size()
 
         if self.last_window_size != current_size:
 
-            print(f"🔄 Font Preview: Window resized to {current_size.width()}x{current_size.height()}")
+            debug_log(f"🔄 Font Preview: Window resized to {current_size.width()}x{current_size.height()}")
 
             self.force_update_preview()
 
@@ -546,6 +633,8 @@ class FontPreviewDialog(QDialog):
 
         self.cached_preview = None
 
-        print("🔄 Font Preview: Forced update triggered")
+        self._dirty = True
+
+        debug_log("🔄 Font Preview: Forced update triggered")
 
-        self.update_preview()
\ No newline at end of file
+        self._coalesce_timer.start(50)
\ No newline at end of file
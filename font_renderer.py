@@ -14,6 +14,7 @@ Features:
 import cv2
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union, Any
+import functools
 import os
 from datetime import datetime
 
@@ -24,13 +25,15 @@ try:
 except ImportError:
     PILLOW_AVAILABLE = False
 
-# TrueType-Support mit OpenCV prüfen
+# TrueType-Support mit OpenCV prüfen (nur Modul-Check, keine Instanz beim Import)
+FREETYPE_AVAILABLE = hasattr(cv2, 'freetype')
+
+# Optionale JIT-Kompilierung für den Alpha-Blend
 try:
-    # Versuche eine FreeType Font-Instanz zu erstellen
-    cv2.freetype.createFreeType2()
-    FREETYPE_AVAILABLE = True
-except:
-    FREETYPE_AVAILABLE = False
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Debug-Optionen
 DEBUG_MODE = False
@@ -69,8 +72,231 @@ def save_debug_image(image, name_prefix="debug"):
     except Exception as e:
         debug_log(f"Fehler beim Speichern des Debug-Bildes: {e}")
 
+@functools.lru_cache(maxsize=64)
+def _get_pil_font(path_or_name: str, size: int):
+    """Geladener Pillow-Font pro (Pfad/Name, Größe) - None wenn nicht ladbar"""
+    try:
+        return ImageFont.truetype(path_or_name, size=size)
+    except Exception:
+        # Fehlschläge ebenfalls cachen, sonst wird die Datei jedes Frame erneut gesucht
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _get_default_pil_font():
+    """Pillow-Standardfont (einmalig geladen)"""
+    return ImageFont.load_default()
+
+def _get_settings_pil_font(font_settings: Any, scale_factor: float = 1.0):
+    """Pillow-Font passend zu font_settings und Skalierung (gecacht)"""
+    font_name = getattr(font_settings, 'font_name', 'Arial')
+    font_path = getattr(font_settings, 'font_path', None)
+    font_size = getattr(font_settings, 'size', 24)
+    
+    # ✅ FIXED: Verbesserte Größenskalierung für konsistente Darstellung
+    # Bei Font-Größe 1.0 in OpenCV entspricht etwa 24 Pixeln
+    base_scale = 24.0
+    # ✅ FIXED: Skalierungsfaktor von 0.75 auf 0.3 reduziert
+    pil_size = int(font_size * base_scale * 0.3 * scale_factor)
+    
+    # Pfad wenn vorhanden, sonst nach Namen laden (einfacher Ansatz)
+    font = _get_pil_font(font_path if font_path and os.path.exists(font_path) else font_name, pil_size)
+    if font is None:
+        # Fallback auf Standardfont
+        font = _get_default_pil_font()
+    return font
+
+# (255 - a) für jeden möglichen uint8-Alphawert, direkt als uint16-Faktor
+_INV255 = (255 - np.arange(256)).astype(np.uint16)
+
+def _blend_color_over_bgr_numpy(dst, alpha, color):
+    """Einfarbige Alphamaske (uint8, gleiche Größe) per Blinn-Blend auf BGR-dst schreiben - in place"""
+    # Alpha-Blending in uint16 (Blinn INT_MULT): x/255 ≈ ((t >> 8) + t) >> 8 mit t = x + 0x80
+    # a*color + (255-a)*dst + 0x80 <= 65153, passt also in uint16
+    # Bewusst ohne Maske über den ganzen Ausschnitt: für a == 0 ergibt die Formel exakt dst
+    a = alpha.astype(np.uint16)[:, :, np.newaxis]
+    inv = _INV255[alpha][:, :, np.newaxis]
+    t = a * color.astype(np.uint16) + inv * dst + 0x80
+    dst[:] = ((t >> 8) + t) >> 8
+    return dst
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _blend_color_kernel(dst, alpha, color):
+        """Einfarbige Alphamaske (uint8, gleiche Größe) per Blinn-Blend auf BGR-dst schreiben - in place"""
+        # Ein Durchlauf ohne Zwischenarrays, gleiche Blinn-Rundung wie die NumPy-Variante.
+        # Verzweigungsfrei (a == 0 ergibt exakt dst), damit LLVM die Zeilen mit der
+        # SIMD-Breite der CPU (SSE/AVX2) vektorisieren kann.
+        for j in prange(alpha.shape[0]):
+            for i in range(alpha.shape[1]):
+                a = np.int32(alpha[j, i])
+                inv = 255 - a
+                for c in range(3):
+                    t = a * color[c] + inv * np.int32(dst[j, i, c]) + 0x80
+                    dst[j, i, c] = ((t >> 8) + t) >> 8
+        return dst
+else:
+    _blend_color_kernel = _blend_color_over_bgr_numpy
+
+def _blend_color_over_bgr(dst, alpha, color):
+    """Textfarbe (BGR-Tupel oder -Liste) über eine Alphamaske auf dst blenden - in place"""
+    return _blend_color_kernel(dst, alpha, np.array(color[:3], dtype=np.int32))
+
+@functools.lru_cache(maxsize=16)
+def _make_border_dilator(border_size: int):
+    """Dilatations-Funktion mit festem (2b+1)-Quadratkernel pro Umrandungsbreite"""
+    kernel = np.ones((2 * border_size + 1, 2 * border_size + 1), np.uint8)
+    return lambda mask: cv2.dilate(mask, kernel)
+
+class GlyphAtlas:
+    """Einmal gerasterte Glyphen-Alphamasken eines Pillow-Fonts für jedes Frame neu gezeichnete Texte"""
+    
+    # Zeichensatz der pro Frame wechselnden Overlay-Texte (FPS-Wert, "FPS", Achsen "16ms")
+    CHARSET = '0123456789.: FPSfpms%-'
+    _CHARSET_SET = frozenset(CHARSET)
+    
+    def __init__(self, font, border_size: int = 0):
+        self.font = font
+        self.border_size = border_size
+        self.dilate_border = _make_border_dilator(border_size) if border_size > 0 else None
+        self.glyphs = {}
+        self._sheet = None
+        for ch in self.CHARSET:
+            self._add_glyph(ch)
+    
+    @classmethod
+    def covers(cls, text: str) -> bool:
+        """True, wenn alle Zeichen von text vorgerastert sind (Atlas wird dann nie verändert)"""
+        return cls._CHARSET_SET.issuperset(text)
+    
+    def _add_glyph(self, ch: str):
+        """Glyph rastern: (Füll-Alpha, Umrandungs-Alpha, x-Versatz, y-Versatz, Vorschub)"""
+        left, top, right, bottom = self.font.getbbox(ch)
+        pad = self.border_size
+        mask = Image.new('L', (max(1, right - left) + 2 * pad, max(1, bottom - top) + 2 * pad), 0)
+        ImageDraw.Draw(mask).text((pad - left, pad - top), ch, fill=255, font=self.font)
+        fill = np.array(mask)
+        border = self.dilate_border(fill) if self.dilate_border is not None else None
+        glyph = (fill, border, left - pad, top - pad, self.font.getlength(ch))
+        self.glyphs[ch] = glyph
+        self._sheet = None  # Blatt beim nächsten Zugriff neu packen
+        return glyph
+    
+    def sheet(self):
+        """Alle Glyphen nebeneinander gepackt: (Füll-Blatt, Umrandungs-Blatt, {Zeichen: Blatt-x})"""
+        if self._sheet is None:
+            height = max(glyph[0].shape[0] for glyph in self.glyphs.values())
+            width = sum(glyph[0].shape[1] for glyph in self.glyphs.values())
+            fill_sheet = np.zeros((height, width), dtype=np.uint8)
+            border_sheet = np.zeros((height, width), dtype=np.uint8)
+            columns = {}
+            sheet_x = 0
+            for ch, (fill, border, offset_x, offset_y, advance) in self.glyphs.items():
+                glyph_h, glyph_w = fill.shape
+                fill_sheet[:glyph_h, sheet_x:sheet_x + glyph_w] = fill
+                if border is not None:
+                    border_sheet[:glyph_h, sheet_x:sheet_x + glyph_w] = border
+                columns[ch] = sheet_x
+                sheet_x += glyph_w
+            self._sheet = (fill_sheet, border_sheet, columns)
+        return self._sheet
+    
+    def get(self, ch: str):
+        """Glyph aus dem Atlas holen (fehlende Zeichen werden nachgerastert)"""
+        glyph = self.glyphs.get(ch)
+        return glyph if glyph is not None else self._add_glyph(ch)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _blend_glyph_run(dst, sheet, rects, color):
+        """Glyphen-Folge aus einem Atlas-Blatt einfarbig auf dst blenden - in place
+        
+        rects: (N, 5) int32 je Glyph: Blatt-x, Breite, Höhe, Ziel-x, Ziel-y
+        """
+        # Sequentiell, da sich Glyphen (vor allem Umrandungen) überlappen
+        h, w = dst.shape[0], dst.shape[1]
+        for k in range(rects.shape[0]):
+            sheet_x, glyph_w, glyph_h, gx, gy = rects[k, 0], rects[k, 1], rects[k, 2], rects[k, 3], rects[k, 4]
+            for j in range(glyph_h):
+                y = gy + j
+                if y < 0 or y >= h:
+                    continue
+                for i in range(glyph_w):
+                    x = gx + i
+                    if x < 0 or x >= w:
+                        continue
+                    a = np.int32(sheet[j, sheet_x + i])
+                    if a == 0:
+                        continue
+                    inv = 255 - a
+                    for c in range(3):
+                        t = a * color[c] + inv * np.int32(dst[y, x, c]) + 0x80
+                        dst[y, x, c] = ((t >> 8) + t) >> 8
+        return dst
+
+@functools.lru_cache(maxsize=32)
+def get_glyph_atlas(font, border_size: int) -> GlyphAtlas:
+    """Atlas pro (gecachtem Font-Objekt, Umrandungsbreite)"""
+    return GlyphAtlas(font, border_size)
+
+def render_atlas_text(image: np.ndarray, text: str, position: Tuple[int, int], atlas: GlyphAtlas,
+                      color: Tuple[int, int, int], border_color: Tuple[int, int, int] = (0, 0, 0),
+                      inplace: bool = False) -> np.ndarray:
+    """
+    Rendert Text durch Blitten vorgerasterter Glyphen aus einem GlyphAtlas (ohne Pillow im Frame-Pfad)
+    
+    Args:
+        image: OpenCV-Bild (numpy.ndarray)
+        text: Zu rendernder Text
+        position: (x, y) Position des Texts (wie bei Pillow: oben links)
+        atlas: GlyphAtlas mit Font und Umrandungsbreite
+        color: Textfarbe (BGR)
+        border_color: Umrandungsfarbe (BGR)
+        inplace: True = direkt in image zeichnen (Rückgabe ist dann dasselbe Array), sonst Kopie
+        
+    Returns:
+        OpenCV-Bild mit gerendertem Text
+    """
+    result = image if inplace else image.copy()
+    h, w = result.shape[:2]
+    x, y = position
+    
+    # Glyphen entlang der Grundlinie platzieren
+    placements = []
+    pen_x = float(x)
+    for ch in text:
+        fill, border, offset_x, offset_y, advance = atlas.get(ch)
+        placements.append((fill, border, int(round(pen_x)) + offset_x, y + offset_y))
+        pen_x += advance
+    
+    # Erst alle Umrandungen, dann alle Füllungen - sonst überdeckt die Umrandung den Nachbarbuchstaben
+    if NUMBA_AVAILABLE and placements:
+        # Ganze Glyphen-Folge in einem kompilierten Aufruf pro Ebene statt einem Blend pro Glyph
+        fill_sheet, border_sheet, columns = atlas.sheet()
+        rects = np.array([(columns[ch], glyph[0].shape[1], glyph[0].shape[0], glyph[2], glyph[3])
+                          for ch, glyph in zip(text, placements)], dtype=np.int32)
+        if atlas.border_size > 0:
+            _blend_glyph_run(result, border_sheet, rects, np.array(border_color[:3], dtype=np.int32))
+        _blend_glyph_run(result, fill_sheet, rects, np.array(color[:3], dtype=np.int32))
+    else:
+        for layer_index, layer_color in ((1, border_color), (0, color)):
+            for glyph in placements:
+                mask = glyph[layer_index]
+                if mask is None:
+                    continue
+                gx, gy = glyph[2], glyph[3]
+                x0, y0 = max(gx, 0), max(gy, 0)
+                x1, y1 = min(gx + mask.shape[1], w), min(gy + mask.shape[0], h)
+                if x1 <= x0 or y1 <= y0:
+                    continue
+                _blend_color_over_bgr(result[y0:y1, x0:x1], mask[y0 - gy:y1 - gy, x0 - gx:x1 - gx], layer_color)
+    
+    if DEBUG_MODE and EXPORT_DEBUG_IMAGES:
+        save_debug_image(result, "atlas_text")
+    
+    return result
+
 def render_truetype_text(image: np.ndarray, text: str, position: Tuple[int, int], 
-                        font_settings: Any, scale_factor: float = 1.0) -> np.ndarray:
+                        font_settings: Any, scale_factor: float = 1.0, inplace: bool = False) -> np.ndarray:
     """
     Rendert Text mit TrueType-Font auf ein Bild
     
@@ -80,6 +306,7 @@ def render_truetype_text(image: np.ndarray, text: str, position: Tuple[int, int]
         position: (x, y) Position des Texts
         font_settings: Font-Einstellungen-Objekt
         scale_factor: Größenskalierungsfaktor
+        inplace: True = direkt in image zeichnen (Rückgabe ist dann dasselbe Array), sonst Kopie
         
     Returns:
         OpenCV-Bild mit gerendertem Text
@@ -96,10 +323,32 @@ def render_truetype_text(image: np.ndarray, text: str, position: Tuple[int, int]
             # Fallback unten
     
     # Fallback auf direkte Methode, wenn render_text nicht verfügbar oder fehlgeschlagen
-    return render_text_with_pillow(image, text, position, font_settings, scale_factor)
+    return render_text_with_pillow(image, text, position, font_settings, scale_factor, inplace)
+
+def render_truetype_text_batch(image: np.ndarray, draw_list: List[Tuple[str, Tuple[int, int], float, Optional[Tuple[int, int, int]]]],
+                               font_settings: Any, inplace: bool = False) -> np.ndarray:
+    """
+    Rendert mehrere Texte mit denselben Font-Einstellungen in ein Bild
+    
+    Args:
+        image: OpenCV-Bild (numpy.ndarray)
+        draw_list: Liste von (Text, Position, Skalierung, Textfarbe oder None)
+        font_settings: Font-Einstellungen-Objekt (text_color wird pro Eintrag gesetzt)
+        inplace: True = direkt in image zeichnen (Rückgabe ist dann dasselbe Array), sonst Kopie
+        
+    Returns:
+        OpenCV-Bild mit allen gerenderten Texten
+    """
+    # Höchstens eine Kopie für die ganze Liste, Fonts/Atlanten kommen aus den Caches
+    result = image if inplace else image.copy()
+    for text, position, scale, color in draw_list:
+        if color is not None:
+            font_settings.text_color = color
+        result = render_truetype_text(result, text, position, font_settings, scale, inplace=True)
+    return result
 
 def render_text_with_pillow(image: np.ndarray, text: str, position: Tuple[int, int],
-                           font_settings: Any, scale_factor: float = 1.0) -> np.ndarray:
+                           font_settings: Any, scale_factor: float = 1.0, inplace: bool = False) -> np.ndarray:
     """
     Rendert Text direkt mit Pillow auf ein OpenCV-Bild
     
@@ -109,118 +358,73 @@ def render_text_with_pillow(image: np.ndarray, text: str, position: Tuple[int, i
         position: (x, y) Position des Texts
         font_settings: Font-Einstellungen-Objekt
         scale_factor: Größenskalierungsfaktor
+        inplace: True = direkt in image zeichnen (Rückgabe ist dann dasselbe Array), sonst Kopie
         
     Returns:
         OpenCV-Bild mit gerendertem Text
     """
     if not PILLOW_AVAILABLE:
         # Wenn Pillow nicht verfügbar ist, Fallback auf OpenCV
-        return render_text_with_opencv(image, text, position, font_settings, scale_factor)
+        return render_text_with_opencv(image, text, position, font_settings, scale_factor, inplace)
     
     try:
         # Eigenschaften aus font_settings extrahieren
-        font_name = getattr(font_settings, 'font_name', 'Arial')
-        font_path = getattr(font_settings, 'font_path', None)
-        font_size = getattr(font_settings, 'size', 24)
-        bold = getattr(font_settings, 'bold', False)
-        italic = getattr(font_settings, 'italic', False)
         text_color = getattr(font_settings, 'text_color', (255, 255, 255))
         border_color = getattr(font_settings, 'border_color', (0, 0, 0))
         border_thickness = getattr(font_settings, 'border_thickness', 2)
         
-        # ✅ FIXED: Verbesserte Größenskalierung für konsistente Darstellung
-        # Bei Font-Größe 1.0 in OpenCV entspricht etwa 24 Pixeln
-        base_scale = 24.0
-        # ✅ FIXED: Skalierungsfaktor von 0.75 auf 0.3 reduziert
-        pil_size = int(font_size * base_scale * 0.3 * scale_factor)
+        # Font aus dem Cache holen
+        font = _get_settings_pil_font(font_settings, scale_factor)
         
-        # Erstelle ein Pillow-Image mit dem Text
+        # Position extrahieren
+        x, y = position
+        border_size = max(1, int(border_thickness * scale_factor)) if border_thickness > 0 else 0
+        
+        # ✅ Nur die Text-Bounding-Box (plus Umrandung) bearbeiten statt des ganzen Frames
         h, w = image.shape[:2]
-        pil_img = Image.new('RGBA', (w, h), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(pil_img)
+        left, top, right, bottom = font.getbbox(text)
+        pad = border_size + 1
+        x0, y0 = max(0, x + left - pad), max(0, y + top - pad)
+        x1, y1 = min(w, x + right + pad), min(h, y + bottom + pad)
         
-        # Versuche den Font zu laden
-        try:
-            if font_path and os.path.exists(font_path):
-                font = ImageFont.truetype(font_path, size=pil_size)
-            else:
-                # Versuche nach Namen zu laden (einfacher Ansatz)
-                font = ImageFont.truetype(font_name, size=pil_size)
-        except:
-            # Fallback auf Standardfont
-            font = ImageFont.load_default()
-            pil_size = max(12, pil_size // 2)  # Standardfont benötigt Anpassung
+        # Erstelle eine Kopie des ursprünglichen Bildes (außer im In-place-Modus)
+        result = image if inplace else image.copy()
+        if x1 <= x0 or y1 <= y0:
+            # Text liegt komplett außerhalb des Bildes
+            return result
         
-        # Position extrahieren
-        x, y = position
+        # Text einmal als 8-Bit-Maske in Größe der Bounding-Box zeichnen (Farbe kommt erst beim Blend)
+        box_w, box_h = x1 - x0, y1 - y0
+        text_mask = Image.new('L', (box_w, box_h), 0)
+        ImageDraw.Draw(text_mask).text((x - x0, y - y0), text, fill=255, font=font)
+        text_alpha = np.asarray(text_mask)
+        
+        # ✅ FIXED: Verbesserte Alpha-Komposition (nur im Bounding-Box-Ausschnitt, roi ist eine View auf result)
+        roi = result[y0:y1, x0:x1]
         
         # Umrandung zeichnen wenn gewünscht
         if border_thickness > 0:
-            # Konvertiere OpenCV BGR zu Pillow RGB
-            border_rgb = (border_color[2], border_color[1], border_color[0], 255)
-            
-            # Zeichne den Text in mehreren Versätzen für die Umrandung
-            border_size = max(1, int(border_thickness * scale_factor))
-            for dx in range(-border_size, border_size + 1):
-                for dy in range(-border_size, border_size + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), text, fill=border_rgb, font=font)
+            # Maske per Dilatation zur Umrandung erweitern
+            # (quadratischer Kernel = Maximum aller alten dx/dy-Versätze)
+            _blend_color_over_bgr(roi, _make_border_dilator(border_size)(text_alpha), border_color)
         
-        # Konvertiere OpenCV BGR zu Pillow RGBA für den Haupttext
-        text_rgba = (text_color[2], text_color[1], text_color[0], 255)
+        # Haupttext darüber
+        _blend_color_over_bgr(roi, text_alpha, text_color)
         
-        # Haupttext zeichnen
-        draw.text((x, y), text, fill=text_rgba, font=font)
+        if DEBUG_MODE and EXPORT_DEBUG_IMAGES:
+            save_debug_image(result, "pillow_text")
         
-        # Konvertiere zurück zu OpenCV
-        pil_img_np = np.array(pil_img)
-        
-        # Nur wenn das Pillow-Bild einen Alpha-Kanal hat
-        if pil_img_np.shape[2] == 4:
-            # ✅ FIXED: Verbesserte Alpha-Komposition
-            # Erstelle eine Kopie des ursprünglichen Bildes
-            result = image.copy()
-            
-            # Extrahiere die Alpha-Maske aus dem Pillow-Bild
-            alpha_mask = pil_img_np[:, :, 3] > 0
-            
-            # Direkte Pixel-Manipulation statt addWeighted
-            if np.any(alpha_mask):
-                # Extrahiere die RGB-Werte aus dem Pillow-Bild
-                # Konvertiere von RGBA zu BGR (für OpenCV)
-                overlay_bgr = pil_img_np[alpha_mask, [2, 1, 0]]
-                
-                # Alpha-Werte extrahieren und normalisieren
-                alpha_values = pil_img_np[alpha_mask, 3].astype(float) / 255.0
-                
-                # Originalpixel holen
-                original_pixels = result[alpha_mask]
-                
-                # Alpha-Blending durchführen: result = (1-alpha)*original + alpha*overlay
-                blended_pixels = (1.0 - alpha_values[:, np.newaxis]) * original_pixels + \
-                                  alpha_values[:, np.newaxis] * overlay_bgr
-                
-                # Zurück ins Ergebnis-Bild schreiben
-                result[alpha_mask] = blended_pixels.astype(np.uint8)
-            
-            if DEBUG_MODE and EXPORT_DEBUG_IMAGES:
-                save_debug_image(result, "pillow_text")
-            
-            return result
-        else:
-            # Bei Problemen mit dem Alpha-Kanal: Fallback auf OpenCV
-            debug_log("Alpha-Kanal fehlt, Fallback auf OpenCV")
-            return render_text_with_opencv(image, text, position, font_settings, scale_factor)
+        return result
             
     except Exception as e:
         debug_log(f"Fehler beim Text-Rendering mit Pillow: {e}")
         import traceback
         debug_log(traceback.format_exc())
         # Fallback auf OpenCV
-        return render_text_with_opencv(image, text, position, font_settings, scale_factor)
+        return render_text_with_opencv(image, text, position, font_settings, scale_factor, inplace)
 
 def render_text_with_opencv(image: np.ndarray, text: str, position: Tuple[int, int],
-                           font_settings: Any, scale_factor: float = 1.0) -> np.ndarray:
+                           font_settings: Any, scale_factor: float = 1.0, inplace: bool = False) -> np.ndarray:
     """
     Rendert Text mit OpenCV auf ein Bild
     
@@ -230,11 +434,12 @@ def render_text_with_opencv(image: np.ndarray, text: str, position: Tuple[int, i
         position: (x, y) Position des Texts
         font_settings: Font-Einstellungen-Objekt
         scale_factor: Größenskalierungsfaktor
+        inplace: True = direkt in image zeichnen (Rückgabe ist dann dasselbe Array), sonst Kopie
         
     Returns:
         OpenCV-Bild mit gerendertem Text
     """
-    result = image.copy()
+    result = image if inplace else image.copy()
     x, y = position
     
     # Eigenschaften aus font_settings extrahieren
@@ -256,14 +461,12 @@ def render_text_with_opencv(image: np.ndarray, text: str, position: Tuple[int, i
         font_scale = font_size * scale_factor * 0.04  # 0.04 Faktor für bessere Skalierung
         thickness = max(1, int(thickness * scale_factor))
     
-    # Rahmen zeichnen
+    # Rahmen zeichnen: ein breiter Strich mit derselben Reichweite wie die alten dx/dy-Versätze
+    # (Versatz scaled_border + halbe Strichbreite (thickness + 1) / 2 zu jeder Seite)
     if border_thickness > 0:
         scaled_border = max(1, int(border_thickness * scale_factor))
-        for dx in range(-scaled_border, scaled_border + 1):
-            for dy in range(-scaled_border, scaled_border + 1):
-                if dx != 0 or dy != 0:
-                    cv2.putText(result, text, (x + dx, y + dy), font, font_scale,
-                              border_color, thickness + 1, cv2.LINE_AA)
+        cv2.putText(result, text, (x, y), font, font_scale,
+                    border_color, thickness + 1 + 2 * scaled_border, cv2.LINE_AA)
     
     # Haupttext zeichnen
     cv2.putText(result, text, (x, y), font, font_scale,
@@ -294,20 +497,15 @@ def create_test_image(width: int = 800, height: int = 600,
     # Leeres Bild erstellen
     image = np.full((height, width, 3), bg_color, dtype=np.uint8)
     
-    # Hintergrund-Gradient für bessere Sichtbarkeit
-    for y in range(height):
-        # Vertikaler Gradient
-        intensity = int(15 + (y / height) * 35)
-        color = (intensity, intensity, intensity + 10)
-        image[y, :] = color
+    # Hintergrund-Gradient für bessere Sichtbarkeit (vertikal, per Broadcast statt Zeilenschleife)
+    intensity = (15 + np.arange(height) / height * 35).astype(np.uint8)
+    image[:] = np.stack([intensity, intensity, intensity + 10], axis=1)[:, None, :]
     
     # Grid-Linien für Referenz
     grid_spacing = 50
     grid_color = (60, 60, 60)
-    for x in range(0, width, grid_spacing):
-        cv2.line(image, (x, 0), (x, height), grid_color, 1)
-    for y in range(0, height, grid_spacing):
-        cv2.line(image, (0, y), (width, y), grid_color, 1)
+    image[:, ::grid_spacing] = grid_color
+    image[::grid_spacing, :] = grid_color
     
     # Text-Positionen
     positions = [
@@ -334,26 +532,25 @@ def create_test_image(width: int = 800, height: int = 600,
             border_color=(0, 0, 0)
         )
     
-    # Verschiedene Text-Varianten rendern
+    # Verschiedene Text-Varianten sammeln und danach in einem Durchgang rendern
+    draw_list = []
     for i, position in enumerate(positions):
         pos_text = f"{text} at {position}"
         y_offset = 0
         
+        # ✅ FIXED: Text-Farbe für bessere Sichtbarkeit
+        if hasattr(font_settings, 'text_color'):
+            color = (255, 255, 255) if i % 2 == 0 else (0, 255, 255)  # Weiß / Gelb
+        else:
+            color = None
+        
         for scale in scale_factors:
             # Position anpassen
             pos = (position[0], position[1] + y_offset)
             
-            # Text rendern
+            # Text vormerken
             scale_text = f"{pos_text} (scale {scale:.1f})"
-            
-            # ✅ FIXED: Text-Farbe für bessere Sichtbarkeit
-            if hasattr(font_settings, 'text_color'):
-                if i % 2 == 0:
-                    font_settings.text_color = (255, 255, 255)  # Weiß
-                else:
-                    font_settings.text_color = (0, 255, 255)    # Gelb
-            
-            image = render_truetype_text(image, scale_text, pos, font_settings, scale)
+            draw_list.append((scale_text, pos, scale, color))
             
             # Offset für nächste Zeile
             if hasattr(font_settings, 'get_text_size'):
@@ -362,6 +559,8 @@ def create_test_image(width: int = 800, height: int = 600,
             else:
                 y_offset += int(30 * scale)
     
+    image = render_truetype_text_batch(image, draw_list, font_settings, inplace=True)
+    
     # Info-Text hinzufügen
     cv2.putText(image, "TrueType Test Image", (width - 200, height - 40),
                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1, cv2.LINE_AA)
@@ -374,6 +573,13 @@ def create_test_image(width: int = 800, height: int = 600,
     
     return image
 
+# Statische Info-Zeilen des Vergleichsbilds, einmal beim Import formatiert
+_INFO_LINES = (
+    f"Pillow Available: {'Yes' if PILLOW_AVAILABLE else 'No'}",
+    f"FreeType Available: {'Yes' if FREETYPE_AVAILABLE else 'No'}",
+    f"OpenCV Version: {cv2.__version__}",
+)
+
 def create_comparison_image(font_settings_list=None, 
                           width: int = 1000, height: int = 800,
                           sample_text: str = "The quick brown fox jumps over the lazy dog") -> np.ndarray:
@@ -392,10 +598,9 @@ def create_comparison_image(font_settings_list=None,
     # Leeres Bild erstellen
     image = np.full((height, width, 3), (20, 20, 30), dtype=np.uint8)
     
-    # Hintergrund mit Gradient
-    for y in range(height):
-        intensity = int(15 + (y / height) * 25)
-        image[y, :] = (intensity, intensity, intensity + 10)
+    # Hintergrund mit Gradient (per Broadcast statt Zeilenschleife)
+    intensity = (15 + np.arange(height) / height * 25).astype(np.uint8)
+    image[:] = np.stack([intensity, intensity, intensity + 10], axis=1)[:, None, :]
     
     # Titel
     cv2.putText(image, "Font Rendering Comparison", (30, 40),
@@ -453,24 +658,19 @@ def create_comparison_image(font_settings_list=None,
         cv2.putText(image, desc_text, (50, y_pos - 20),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1, cv2.LINE_AA)
         
-        # Beispieltext rendern
-        image = render_truetype_text(image, sample_text, (50, y_pos), font_settings, 1.0)
-        
-        # Skalierte Version
-        image = render_truetype_text(image, sample_text, (50, y_pos + 50), font_settings, 1.5)
+        # Beispieltext und skalierte Version rendern
+        image = render_truetype_text_batch(image, [
+            (sample_text, (50, y_pos), 1.0, None),
+            (sample_text, (50, y_pos + 50), 1.5, None)
+        ], font_settings, inplace=True)
         cv2.putText(image, "(Scale: 1.5x)", (width - 150, y_pos + 50),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1, cv2.LINE_AA)
         
         # Nächste Position
         y_pos += 120
     
-    # Informationen
-    info_text = [
-        f"Pillow Available: {'Yes' if PILLOW_AVAILABLE else 'No'}",
-        f"FreeType Available: {'Yes' if FREETYPE_AVAILABLE else 'No'}",
-        f"OpenCV Version: {cv2.__version__}",
-        "Debug Mode: " + ("Active" if DEBUG_MODE else "Inactive")
-    ]
+    # Informationen (nur der Debug-Status kann sich zur Laufzeit ändern)
+    info_text = _INFO_LINES + ("Debug Mode: " + ("Active" if DEBUG_MODE else "Inactive"),)
     
     for i, text in enumerate(info_text):
         cv2.putText(image, text, (width - 300, height - 80 + i*20),
@@ -559,8 +759,12 @@ def run_rendering_test(font_settings=None, export=True):
 
 __all__ = [
     'render_truetype_text',
+    'render_truetype_text_batch',
     'render_text_with_pillow',
     'render_text_with_opencv',
+    'render_atlas_text',
+    'get_glyph_atlas',
+    'GlyphAtlas',
     'create_test_image',
     'create_comparison_image',
     'run_rendering_test',
@@ -14,6 +14,7 @@ COMPLETE VERSION with all features integrated
 import sys
 import os
 import time
+from dataclasses import dataclass, field
 import cv2
 import numpy as np
 import torch
@@ -43,69 +44,157 @@ except ImportError as e:
     FONT_MANAGER_AVAILABLE = False
     # Create a fallback OpenCVFontSettings class
 
+    @dataclass(slots=True, eq=False)
     class OpenCVFontSettings:
         """Fallback OpenCVFontSettings class"""
 
-        def __init__(self, font_name='HERSHEY_SIMPLEX', size=1.0, thickness=2, 
-
-                     bold=False, border_thickness=2, border_color=(0, 0, 0)):
-
-            self.font_name = font_name
-
-            self.size = size
-
-            self.thickness = thickness
-
-            self.bold = bold
-
-            self.border_thickness = border_thickness
+        font_name: str = 'HERSHEY_SIMPLEX'
+        size: float = 1.0
+        thickness: int = 2
+        bold: bool = False
+        border_thickness: int = 2
+        border_color: tuple = (0, 0, 0)
+        _qfont: object = field(default=None, init=False, repr=False)
+        _qfont_key: tuple = field(default=None, init=False, repr=False)
+
+        # Built once at class definition instead of on every get_opencv_font call
+        _OPENCV_FONTS = {
+            'HERSHEY_SIMPLEX': cv2.FONT_HERSHEY_SIMPLEX,
+            'HERSHEY_PLAIN': cv2.FONT_HERSHEY_PLAIN,
+            'HERSHEY_DUPLEX': cv2.FONT_HERSHEY_DUPLEX,
+            'HERSHEY_COMPLEX': cv2.FONT_HERSHEY_COMPLEX,
+            'HERSHEY_TRIPLEX': cv2.FONT_HERSHEY_TRIPLEX,
+            'HERSHEY_COMPLEX_SMALL': cv2.FONT_HERSHEY_COMPLEX_SMALL,
+            'HERSHEY_SCRIPT_SIMPLEX': cv2.FONT_HERSHEY_SCRIPT_SIMPLEX,
+            'HERSHEY_SCRIPT_COMPLEX': cv2.FONT_HERSHEY_SCRIPT_COMPLEX
+        }
+        _QFONT_FAMILY = {
+            'HERSHEY_SIMPLEX': 'Arial',
+            'HERSHEY_PLAIN': 'Arial',
+            'HERSHEY_DUPLEX': 'Consolas',
+            'HERSHEY_COMPLEX': 'Arial Black',
+            'HERSHEY_TRIPLEX': 'Impact',
+            'HERSHEY_COMPLEX_SMALL': 'Arial',
+            'HERSHEY_SCRIPT_SIMPLEX': 'Times New Roman',
+            'HERSHEY_SCRIPT_COMPLEX': 'Georgia'
+        }
 
-            self.border_color = border_color
         def get_opencv_font(self):
 
             """Get OpenCV font constant"""
-            import cv2
-            font_mapping = {
-                'HERSHEY_SIMPLEX': cv2.FONT_HERSHEY_SIMPLEX,
-                'HERSHEY_PLAIN': cv2.FONT_HERSHEY_PLAIN,
-                'HERSHEY_DUPLEX': cv2.FONT_HERSHEY_DUPLEX,
-                'HERSHEY_COMPLEX': cv2.FONT_HERSHEY_COMPLEX,
-                'HERSHEY_TRIPLEX': cv2.FONT_HERSHEY_TRIPLEX,
-                'HERSHEY_COMPLEX_SMALL': cv2.FONT_HERSHEY_COMPLEX_SMALL,
-                'HERSHEY_SCRIPT_SIMPLEX': cv2.FONT_HERSHEY_SCRIPT_SIMPLEX,
-                'HERSHEY_SCRIPT_COMPLEX': cv2.FONT_HERSHEY_SCRIPT_COMPLEX
-            }
-            return font_mapping.get(self.font_name, cv2.FONT_HERSHEY_SIMPLEX)
+            return self._OPENCV_FONTS.get(self.font_name, cv2.FONT_HERSHEY_SIMPLEX)
         def get_effective_thickness(self):
             """Get thickness with bold modifier"""
-
-            base_thickness = self.thickness
-
-            if self.bold:
-
-                return base_thickness + 2
-
-            return base_thickness
+            return self.thickness + (2 if self.bold else 0)
         def to_qfont(self):
 
             """Convert to QFont for compatibility"""
-            font_mapping = {
-                'HERSHEY_SIMPLEX': 'Arial',
-                'HERSHEY_PLAIN': 'Arial',
-                'HERSHEY_DUPLEX': 'Consolas',
-                'HERSHEY_COMPLEX': 'Arial Black',
-                'HERSHEY_TRIPLEX': 'Impact',
-                'HERSHEY_COMPLEX_SMALL': 'Arial',
-                'HERSHEY_SCRIPT_SIMPLEX': 'Times New Roman',
-                'HERSHEY_SCRIPT_COMPLEX': 'Georgia'
-            }
-            qt_family = font_mapping.get(self.font_name, 'Arial')
-            qt_size = int(self.size * 12)
-            qfont = QFont(qt_family, qt_size)
-            qfont.setBold(self.bold)
-            return qfont
+            # Reuse the resolved QFont until font_name, size or bold change
+            key = (self.font_name, self.size, self.bold)
+            if key != self._qfont_key:
+                qt_family = self._QFONT_FAMILY.get(self.font_name, 'Arial')
+                qt_size = int(self.size * 12)
+                self._qfont = QFont(qt_family, qt_size)
+                self._qfont.setBold(self.bold)
+                self._qfont_key = key
+            return QFont(self._qfont)
+# Combo-backed UI settings: (settings key, combo attribute, default, kind)
+# 'data' matches itemData, 'index' is the row, 'bitrate' stores ints for numeric items
+
+_SETTINGS_SCHEMA = (
+    ('output_resolution', 'resolution_combo', (1920, 1080), 'data'),
+    ('bitrate', 'bitrate_combo', 60, 'bitrate'),
+    ('frametime_scale_index', 'frametime_scale_combo', 1, 'index'),
+    ('sensitivity_index', 'sensitivity_combo', 2, 'index'),
+)
+def _restore_combo(combo, value, kind):
+    """Select the combo entry for a saved settings value"""
+    if kind == 'index':
+        if isinstance(value, int) and 0 <= value < combo.count():
+            combo.setCurrentIndex(value)
+        return
+    if kind == 'bitrate':
+        if value != 'opencv':
+            if not isinstance(value, int):
+                return
+            value = str(value)
+    for i in range(combo.count()):
+        if combo.itemData(i) == value:
+            combo.setCurrentIndex(i)
+            break
+def _read_combo(combo, default, kind):
+    """Convert the current combo entry back to its settings value"""
+    if kind == 'index':
+        return combo.currentIndex()
+    data = combo.currentData()
+    if kind == 'bitrate':
+        if data == 'opencv':
+            return data
+        return int(data) if isinstance(data, str) and data.isdigit() else default
+    return data
+# torch only tells us a GPU exists - the preview path needs OpenCV's own CUDA module
+
+try:
+    OPENCV_CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    OPENCV_CUDA_AVAILABLE = False
 class FPSAnalyzer(QMainWindow):
     """Main FPS Analyzer Application with Video Comparison Feature + settings persistence and Layout Editor + Segment Selection"""
+    # Segment stylesheets, built once and only re-applied when the state changes
+
+    _SEGMENT_STYLE_READY = """
+        QPushButton {
+            font-size: 12px; padding: 6px 12px; 
+            background-color: #2E7D32; color: white; 
+            border: none; border-radius: 4px; font-weight: bold;
+        }
+        QPushButton:hover { background-color: #4CAF50; }
+        QPushButton:disabled { background-color: #404040; color: #666; }
+    """
+
+    _SEGMENT_STYLE_END = """
+        QPushButton {
+            font-size: 12px; padding: 6px 12px; 
+            background-color: #C62828; color: white; 
+            border: none; border-radius: 4px; font-weight: bold;
+        }
+        QPushButton:hover { background-color: #f44336; }
+        QPushButton:disabled { background-color: #404040; color: #666; }
+    """
+
+    _SEGMENT_STYLE_COMPLETE = """
+        QPushButton {
+            font-size: 12px; padding: 6px 12px; 
+            background-color: #4CAF50; color: white; 
+            border: 1px solid #66BB6A; border-radius: 4px; font-weight: bold;
+        }
+        QPushButton:hover { background-color: #66BB6A; }
+        QPushButton:disabled { background-color: #404040; color: #666; }
+    """
+
+    _SEGMENT_INFO_STYLE_EMPTY = """
+        QLabel {
+            color: #aaaaaa; font-size: 11px; padding: 6px 8px;
+            background-color: #1a1a1a; border-radius: 3px;
+            border: 1px solid #444;
+        }
+    """
+
+    _SEGMENT_INFO_STYLE_START = """
+        QLabel {
+            color: #FF9800; font-size: 11px; padding: 6px 8px; font-weight: bold;
+            background-color: #1a1a1a; border-radius: 3px;
+            border: 1px solid #FF9800;
+        }
+    """
+
+    _SEGMENT_INFO_STYLE_FULL = """
+        QLabel {
+            color: #4CAF50; font-size: 11px; padding: 6px 8px; font-weight: bold;
+            background-color: #1a1a1a; border-radius: 3px;
+            border: 1px solid #4CAF50;
+        }
+    """
     def __init__(self):
 
         super().__init__()
@@ -117,9 +206,27 @@ class FPSAnalyzer(QMainWindow):
 
         self.video_cap = None
 
+        self._last_frame = None  # Last decoded frame shown in the preview
+
         self.playback_timer = QTimer(self)
 
         self.playback_timer.timeout.connect(self.next_frame)
+        # Coalesces bursts of settings changes into one write
+
+        self._save_timer = QTimer(self)
+
+        self._save_timer.setSingleShot(True)
+
+        self._save_timer.timeout.connect(self.save_current_settings)
+        # Console copies of log messages, written in one batch per ~16 ms
+
+        self._log_buf = []
+
+        self._log_flush_timer = QTimer(self)
+
+        self._log_flush_timer.setSingleShot(True)
+
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
 
         self.analysis_worker = None
 
@@ -135,11 +242,50 @@ class FPSAnalyzer(QMainWindow):
         self.video_fps = 30.0  # Default FPS
 
         self.segment_state = 0  # 0=set_start, 1=set_end, 2=complete
+
+        self._segment_display_handlers = {
+
+            0: self._segment_display_empty,
+
+            1: self._segment_display_start_only,
+
+            2: self._segment_display_full
+
+        }
+
+        # Time strings of the current selection, refreshed only when it changes
+
+        self._start_time_str = None
+
+        self._end_time_str = None
+
+        self._duration_str = None
+
+        self._segment_btn_style = None  # Stylesheet currently applied to segment_btn
+
+        self._segment_info_style = None  # Stylesheet currently applied to segment_info_label
         # Preview settings
 
         self.internal_resolution = (1920, 1080)
 
-        self.preview_quality = cv2.INTER_LANCZOS4
+        self.preview_quality = cv2.INTER_LINEAR
+
+        self._rgb_buf = None  # Persistent RGB preview buffer, sized to internal_resolution
+
+        self._qimg = None  # QImage wrapping _rgb_buf
+
+        self._preview_pixmap = None  # _last_frame at internal resolution, before widget scaling
+
+        self._preview_key = None  # (internal_resolution, preview_quality) of _preview_pixmap
+        # GPU preview: upload once per frame, resize + convert on the device
+
+        use_gpu_preview = self.cuda_available and OPENCV_CUDA_AVAILABLE
+
+        self._gpu_frame = cv2.cuda_GpuMat() if use_gpu_preview else None
+
+        self._gpu_resized = cv2.cuda_GpuMat() if use_gpu_preview else None
+
+        self._gpu_rgb = cv2.cuda_GpuMat() if use_gpu_preview else None
         # Settings Manager for persistence
 
         self.settings_manager = SettingsManager()
@@ -171,8 +317,18 @@ class FPSAnalyzer(QMainWindow):
 
         self.segment_state = 0  # Always start fresh
         # 🔧 FIXED: Font settings initialization with fallback
+        # Deferred to the first event-loop pass so the window paints before fonts are loaded.
+        # Until then the font settings are None (the overlay renderers fall back to legacy text)
+
+        self.fps_font_settings = None
+
+        self.framerate_font_settings = None
 
-        self.initialize_font_settings(saved_settings)
+        self.frametime_font_settings = None
+
+        self._pending_font_settings = saved_settings
+
+        QTimer.singleShot(0, self.ensure_font_settings)
         # Legacy QFont compatibility
 
         self.fps_font = QFont("Arial", 12)
@@ -188,14 +344,25 @@ class FPSAnalyzer(QMainWindow):
         # Theme - Load from saved settings
 
         self.current_theme = saved_settings.get('theme', 'dark')
+        # Frame time graph position - Load from saved settings
+
+        self.ftg_position = saved_settings.get('ftg_position', 'bottom_right')
         # Initialize components
 
-        self.setup_application()
+        self.setup_application(saved_settings)
         
+    def ensure_font_settings(self):
+        """Run the deferred font initialization now if it has not run yet"""
+        saved_settings, self._pending_font_settings = self._pending_font_settings, None
+        if saved_settings is not None:
+            self.initialize_font_settings(saved_settings)
+    
     def initialize_font_settings(self, saved_settings):
         """🔧 ENHANCED: Initialize font settings with TrueType support"""
+        # Status lines are collected and written to the console in one go
+        lines = []
         try:
-            print("🎨 Initializing Enhanced Font System with TrueType support...")
+            lines.append("🎨 Initializing Enhanced Font System with TrueType support...")
             
             # Import enhanced font manager
             from font_manager import OpenCVFontSettings, get_font_manager, PILLOW_AVAILABLE, FREETYPE_AVAILABLE
@@ -203,10 +370,10 @@ class FPSAnalyzer(QMainWindow):
             # Get font manager instance
             font_manager = get_font_manager()
             
-            print(f"✅ Font Manager Status:")
-            print(f"   • Pillow/TrueType Support: {'✅ Available' if PILLOW_AVAILABLE else '❌ Not Available'}")
-            print(f"   • OpenCV FreeType Support: {'✅ Available' if FREETYPE_AVAILABLE else '❌ Not Available'}")
-            print(f"   • System Fonts: {len(font_manager.available_fonts)} discovered")
+            lines.append(f"✅ Font Manager Status:")
+            lines.append(f"   • Pillow/TrueType Support: {'✅ Available' if PILLOW_AVAILABLE else '❌ Not Available'}")
+            lines.append(f"   • OpenCV FreeType Support: {'✅ Available' if FREETYPE_AVAILABLE else '❌ Not Available'}")
+            lines.append(f"   • System Fonts: {len(font_manager.available_fonts)} discovered")
             
             # FPS Font Settings - DEFAULT TO BEBAS NEUE
             fps_font_name = saved_settings.get('fps_font_name', 'BebasNeue-Regular')
@@ -257,16 +424,18 @@ class FPSAnalyzer(QMainWindow):
             )
             
             # Status summary
-            print(f"✅ Enhanced Font Settings initialized successfully:")
-            print(f"   • FPS Font: {self.fps_font_settings.font_name}")
-            print(f"   • Framerate Font: {self.framerate_font_settings.font_name}")
-            print(f"   • Frametime Font: {self.frametime_font_settings.font_name}")
+            lines.append(f"✅ Enhanced Font Settings initialized successfully:")
+            lines.append(f"   • FPS Font: {self.fps_font_settings.font_name}")
+            lines.append(f"   • Framerate Font: {self.framerate_font_settings.font_name}")
+            lines.append(f"   • Frametime Font: {self.frametime_font_settings.font_name}")
             
         except Exception as e:
-            print(f"⚠️ Error initializing enhanced font settings: {e}")
+            lines.append(f"⚠️ Error initializing enhanced font settings: {e}")
             # ... rest of the error handling
+        finally:
+            sys.stdout.write('\n'.join(lines) + '\n')
     
-    def setup_application(self):
+    def setup_application(self, saved_settings=None):
 
         """Initialize all application components"""
 
@@ -284,72 +453,27 @@ class FPSAnalyzer(QMainWindow):
         self.apply_theme(self.current_theme)
         # Load saved UI settings
 
-        self.load_ui_settings()
+        self.load_ui_settings(saved_settings)
         self.log("✓ FPS Analyzer initialized successfully with saved settings and segment selection!")
-    def load_ui_settings(self):
+    def load_ui_settings(self, saved_settings=None):
         """Load saved UI settings into widgets - UPDATED for opencv handling"""
 
-        saved_settings = self.settings_manager.load_settings()
-        try:
-
-            # Load resolution setting
-
-            saved_resolution = saved_settings.get('output_resolution', (1920, 1080))
-
-            for i in range(self.resolution_combo.count()):
-
-                if self.resolution_combo.itemData(i) == saved_resolution:
-
-                    self.resolution_combo.setCurrentIndex(i)
+        # __init__ passes the settings it already parsed
+        if saved_settings is None:
 
-                    break
-            # Load bitrate setting with proper opencv handling
-
-            saved_bitrate = saved_settings.get('bitrate', 60)
-            if saved_bitrate == 'opencv':
-
-                # Find and select the 'opencv' option
-
-                for i in range(self.bitrate_combo.count()):
-
-                    if self.bitrate_combo.itemData(i) == 'opencv':
-
-                        self.bitrate_combo.setCurrentIndex(i)
-
-                        break
-
-            elif isinstance(saved_bitrate, int):
-
-                # Find and select the numeric bitrate
-
-                for i in range(self.bitrate_combo.count()):
-
-                    item_data = self.bitrate_combo.itemData(i)
+            saved_settings = self.settings_manager.load_settings()
+        try:
 
-                    if isinstance(item_data, str) and item_data.isdigit() and int(item_data) == saved_bitrate:
+            # Restore all combo-backed settings in one pass
 
-                        self.bitrate_combo.setCurrentIndex(i)
+            for key, attr, default, kind in _SETTINGS_SCHEMA:
 
-                        break
+                _restore_combo(getattr(self, attr), saved_settings.get(key, default), kind)
             # Update the method label immediately
 
             if hasattr(self.ui_manager, 'update_bitrate_method_label'):
 
                 self.ui_manager.update_bitrate_method_label()
-            # Load frametime scale setting
-
-            saved_frametime_scale = saved_settings.get('frametime_scale_index', 1)
-
-            if 0 <= saved_frametime_scale < self.frametime_scale_combo.count():
-
-                self.frametime_scale_combo.setCurrentIndex(saved_frametime_scale)
-            # Load sensitivity setting
-
-            saved_sensitivity_index = saved_settings.get('sensitivity_index', 2)
-
-            if 0 <= saved_sensitivity_index < self.sensitivity_combo.count():
-
-                self.sensitivity_combo.setCurrentIndex(saved_sensitivity_index)
             # Load preview settings
 
             saved_internal_res = saved_settings.get('internal_resolution', (1920, 1080))
@@ -360,61 +484,49 @@ class FPSAnalyzer(QMainWindow):
             if self.start_frame is not None or self.end_frame is not None:
 
                 self.update_segment_display()
-            self.log(f"✓ Loaded saved settings: {saved_resolution}, bitrate: {saved_bitrate}")
+            self.log(f"✓ Loaded saved settings: {saved_settings.get('output_resolution', (1920, 1080))}, bitrate: {saved_settings.get('bitrate', 60)}")
         except Exception as e:
 
             self.log(f"⚠️ Could not load some UI settings: {e}")
+    def schedule_save_settings(self):
+        """Save settings once changes have been idle for 500 ms"""
+        self._save_timer.start(500)
     def save_current_settings(self):
         """🔧 ENHANCED: Save current settings including TrueType font paths"""
         try:
-            # Get current bitrate value properly
-            current_bitrate = 60  # fallback
-            if hasattr(self, 'bitrate_combo'):
-                bitrate_data = self.bitrate_combo.currentData()
-                if bitrate_data == 'opencv':
-                    current_bitrate = 'opencv'
-                elif isinstance(bitrate_data, str) and bitrate_data.isdigit():
-                    current_bitrate = int(bitrate_data)
-                else:
-                    current_bitrate = 60
-
+            # Never save the placeholders over the user's saved fonts
+            self.ensure_font_settings()
             # 🎨 ENHANCED: Collect font settings with TrueType paths
             settings = {
                 # Enhanced font settings with TrueType support
                 'fps_font_name': self.fps_font_settings.font_name,
-                'fps_font_path': getattr(self.fps_font_settings, 'font_path', None),
+                'fps_font_path': self.fps_font_settings.font_path,
                 'fps_font_size': self.fps_font_settings.size,
                 'fps_font_thickness': self.fps_font_settings.thickness,
                 'fps_font_bold': self.fps_font_settings.bold,
-                'fps_font_border': getattr(self.fps_font_settings, 'border_thickness', 2),
+                'fps_font_border': self.fps_font_settings.border_thickness,
 
                 'framerate_font_name': self.framerate_font_settings.font_name,
-                'framerate_font_path': getattr(self.framerate_font_settings, 'font_path', None),
+                'framerate_font_path': self.framerate_font_settings.font_path,
                 'framerate_font_size': self.framerate_font_settings.size,
                 'framerate_font_thickness': self.framerate_font_settings.thickness,
                 'framerate_font_bold': self.framerate_font_settings.bold,
-                'framerate_font_border': getattr(self.framerate_font_settings, 'border_thickness', 2),
+                'framerate_font_border': self.framerate_font_settings.border_thickness,
 
                 'frametime_font_name': self.frametime_font_settings.font_name,
-                'frametime_font_path': getattr(self.frametime_font_settings, 'font_path', None),
+                'frametime_font_path': self.frametime_font_settings.font_path,
                 'frametime_font_size': self.frametime_font_settings.size,
                 'frametime_font_thickness': self.frametime_font_settings.thickness,
                 'frametime_font_bold': self.frametime_font_settings.bold,
-                'frametime_font_border': getattr(self.frametime_font_settings, 'border_thickness', 2),
+                'frametime_font_border': self.frametime_font_settings.border_thickness,
 
                 # Color settings
                 'framerate_color': self.framerate_color,
                 'frametime_color': self.frametime_color,
 
-                # UI settings
-                'output_resolution': self.resolution_combo.currentData() if hasattr(self, 'resolution_combo') else (1920, 1080),
-                'bitrate': current_bitrate,
-                'frametime_scale_index': self.frametime_scale_combo.currentIndex() if hasattr(self, 'frametime_scale_combo') else 1,
-                'sensitivity_index': self.sensitivity_combo.currentIndex() if hasattr(self, 'sensitivity_combo') else 2,
-
                 # Other settings
                 'theme': self.current_theme,
-                'ftg_position': getattr(self, 'ftg_position', 'bottom_right'),
+                'ftg_position': self.ftg_position,
                 'internal_resolution': self.internal_resolution,
 
                 # Layout settings
@@ -422,9 +534,14 @@ class FPSAnalyzer(QMainWindow):
                 
                 # Enhanced font system info
                 'font_system_version': '2.0_freetype',
-                'freetype_available': getattr(self.fps_font_settings, 'is_freetype_available', lambda: False)()
+                'freetype_available': self.fps_font_settings.is_freetype_available()
             }
 
+            # UI settings, read back through the same schema used for loading
+            for key, attr, default, kind in _SETTINGS_SCHEMA:
+                combo = getattr(self, attr, None)
+                settings[key] = _read_combo(combo, default, kind) if combo is not None else default
+
             self.settings_manager.save_settings(settings)
             
             # Enhanced status message
@@ -443,19 +560,9 @@ class FPSAnalyzer(QMainWindow):
             from font_manager import FontPreviewDialog, FREETYPE_AVAILABLE
             # Get current frame if video is loaded
 
-            current_frame = None
-
-            if self.video_cap and self.video_cap.isOpened():
-
-                current_pos = self.video_cap.get(cv2.CAP_PROP_POS_FRAMES)
-
-                ret, frame = self.video_cap.read()
-
-                if ret:
-
-                    current_frame = frame
+            # Reuse the frame already on screen - no extra decode or seek
 
-                    self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, max(0, current_pos - 1))
+            current_frame = self._last_frame if self.video_cap and self.video_cap.isOpened() else None
             # Open enhanced preview dialog
 
             preview_dialog = FontPreviewDialog(self, current_frame)
@@ -524,7 +631,7 @@ class FPSAnalyzer(QMainWindow):
                 self.log(f"  • Frametime: {frametime_settings.font_name} ({frametime_type}) Size:{frametime_settings.size}")
                 # Save enhanced settings
 
-                self.save_current_settings()
+                self.schedule_save_settings()
         except ImportError as e:
             self.log(f"❌ Enhanced font selection not available: {e}")
 
@@ -570,9 +677,9 @@ class FPSAnalyzer(QMainWindow):
 
             self.segment_state = 1
 
-            time_str = self.frame_to_time_string(current_frame)
+            self._refresh_segment_times()
 
-            self.log(f"📍 Start point set at frame {current_frame} ({time_str})")
+            self.log(f"📍 Start point set at frame {current_frame} ({self._start_time_str})")
         elif self.segment_state == 1:
 
             # Set end point
@@ -583,7 +690,7 @@ class FPSAnalyzer(QMainWindow):
 
                                    f'End point must be after start point!\n\n'
 
-                                   f'Start: {self.frame_to_time_string(self.start_frame)}\n'
+                                   f'Start: {self._start_time_str}\n'
 
                                    f'Current: {self.frame_to_time_string(current_frame)}\n\n'
 
@@ -594,15 +701,13 @@ class FPSAnalyzer(QMainWindow):
 
             self.segment_state = 2
 
-            time_str = self.frame_to_time_string(current_frame)
+            self._refresh_segment_times()
 
             duration_frames = self.end_frame - self.start_frame
 
-            duration_time = self.frame_to_time_string(duration_frames)
+            self.log(f"📍 End point set at frame {current_frame} ({self._end_time_str})")
 
-            self.log(f"📍 End point set at frame {current_frame} ({time_str})")
-
-            self.log(f"📊 Segment duration: {duration_frames} frames ({duration_time})")
+            self.log(f"📊 Segment duration: {duration_frames} frames ({self._duration_str})")
         # Update UI
 
         self.update_segment_display()
@@ -615,10 +720,18 @@ class FPSAnalyzer(QMainWindow):
         self.start_frame = None
         self.end_frame = None
         self.segment_state = 0
+        self._refresh_segment_times()
         self.update_segment_display()
         self.update_segment_buttons()
         self.log("🗑️ Segment selection cleared")
         # Don't save settings - segments are video-specific
+    def _refresh_segment_times(self):
+
+        """Recompute the cached start/end/duration strings after a selection change"""
+        start, end = self.start_frame, self.end_frame
+        self._start_time_str = self.frame_to_time_string(start) if start is not None else None
+        self._end_time_str = self.frame_to_time_string(end) if end is not None else None
+        self._duration_str = self.frame_to_time_string(end - start) if start is not None and end is not None else None
     def frame_to_time_string(self, frame_number):
         """Convert frame number to time string (MM:SS or HH:MM:SS)"""
 
@@ -644,62 +757,34 @@ class FPSAnalyzer(QMainWindow):
         """Update segment info display"""
         if not hasattr(self, 'segment_info_label'):
             return  # UI not ready yet
-        if self.start_frame is None and self.end_frame is None:
-            self.segment_info_label.setText("No segment")
-            self.segment_info_label.setStyleSheet("""
-                QLabel {
-                    color: #aaaaaa; font-size: 11px; padding: 6px 8px;
-                    background-color: #1a1a1a; border-radius: 3px;
-                    border: 1px solid #444;
-                }
-            """)
-
-            return
-        if self.start_frame is not None and self.end_frame is not None:
+        text, style = self._segment_display_handlers[self.segment_state]()
 
-            # Full selection
+        self.segment_info_label.setText(text)
 
-            start_time = self.frame_to_time_string(self.start_frame)
+        self._set_segment_info_style(style)
+    def _segment_display_empty(self):
 
-            end_time = self.frame_to_time_string(self.end_frame)
+        """Label text and style with no selection"""
+        return "No segment", self._SEGMENT_INFO_STYLE_EMPTY
+    def _segment_display_start_only(self):
 
-            duration_frames = self.end_frame - self.start_frame
+        """Label text and style with only the start point set"""
+        return f"Start: {self._start_time_str}", self._SEGMENT_INFO_STYLE_START
+    def _segment_display_full(self):
 
-            duration_time = self.frame_to_time_string(duration_frames)
-            # Calculate percentage of total video
+        """Label text and style for a complete selection"""
+        duration_frames = self.end_frame - self.start_frame
+        # Calculate percentage of total video
 
-            percentage = (duration_frames / self.total_frames * 100) if self.total_frames > 0 else 0
-            text = f"{start_time} → {end_time} ({percentage:.0f}%)"
+        percentage = (duration_frames / self.total_frames * 100) if self.total_frames > 0 else 0
 
-            self.segment_info_label.setText(text)
+        return f"{self._start_time_str} → {self._end_time_str} ({percentage:.0f}%)", self._SEGMENT_INFO_STYLE_FULL
+    def _set_segment_info_style(self, style):
 
-            self.segment_info_label.setStyleSheet("""
-
-                QLabel {
-
-                    color: #4CAF50; font-size: 11px; padding: 6px 8px; font-weight: bold;
-
-                    background-color: #1a1a1a; border-radius: 3px;
-
-                    border: 1px solid #4CAF50;
-
-                }
-
-            """)
-        elif self.start_frame is not None:
-
-            # Only start set
-
-            start_time = self.frame_to_time_string(self.start_frame)
-            text = f"Start: {start_time}"
-            self.segment_info_label.setText(text)
-            self.segment_info_label.setStyleSheet("""
-                QLabel {
-                    color: #FF9800; font-size: 11px; padding: 6px 8px; font-weight: bold;
-                    background-color: #1a1a1a; border-radius: 3px;
-                    border: 1px solid #FF9800;
-                }
-            """)
+        """Apply a segment label stylesheet only if it differs from the current one"""
+        if style is not self._segment_info_style:
+            self.segment_info_label.setStyleSheet(style)
+            self._segment_info_style = style
     def update_segment_buttons(self):
 
         """🎯 NEW: Update segment button state and labels"""
@@ -710,61 +795,33 @@ class FPSAnalyzer(QMainWindow):
             # Ready to set start
 
             self.segment_btn.setText("📍 Set Start Point")
-            self.segment_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 12px; padding: 6px 12px; 
-                    background-color: #2E7D32; color: white; 
-                    border: none; border-radius: 4px; font-weight: bold;
-                }
-                QPushButton:hover { background-color: #4CAF50; }
-                QPushButton:disabled { background-color: #404040; color: #666; }
-            """)
+            style = self._SEGMENT_STYLE_READY
 
             self.segment_btn.setEnabled(True)
         elif self.segment_state == 1:
 
             # Ready to set end
 
-            start_time = self.frame_to_time_string(self.start_frame) if self.start_frame is not None else "00:00"
-
             self.segment_btn.setText(f"📍 Set End Point")
 
-            self.segment_btn.setStyleSheet("""
-
-                QPushButton {
-
-                    font-size: 12px; padding: 6px 12px; 
-
-                    background-color: #C62828; color: white; 
-
-                    border: none; border-radius: 4px; font-weight: bold;
-
-                }
-
-                QPushButton:hover { background-color: #f44336; }
-
-                QPushButton:disabled { background-color: #404040; color: #666; }
-
-            """)
+            style = self._SEGMENT_STYLE_END
             self.segment_btn.setEnabled(True)
-        elif self.segment_state == 2:
+        else:
 
             # Selection complete
 
-            duration_frames = self.end_frame - self.start_frame if (self.start_frame is not None and self.end_frame is not None) else 0
-            duration_time = self.frame_to_time_string(duration_frames)
+            duration_time = self._duration_str or "00:00"
             self.segment_btn.setText(f"✅ Complete ({duration_time})")
-            self.segment_btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 12px; padding: 6px 12px; 
-                    background-color: #4CAF50; color: white; 
-                    border: 1px solid #66BB6A; border-radius: 4px; font-weight: bold;
-                }
-                QPushButton:hover { background-color: #66BB6A; }
-                QPushButton:disabled { background-color: #404040; color: #666; }
-            """)
+            style = self._SEGMENT_STYLE_COMPLETE
 
             self.segment_btn.setEnabled(False)  # Disabled when complete
+        # Restyling re-polishes the button, so skip it while the state is unchanged
+
+        if style is not self._segment_btn_style:
+
+            self.segment_btn.setStyleSheet(style)
+
+            self._segment_btn_style = style
         # Enable/disable clear button
 
         has_selection = self.start_frame is not None or self.end_frame is not None
@@ -820,7 +877,7 @@ class FPSAnalyzer(QMainWindow):
 
             # Save settings
 
-            self.save_current_settings()
+            self.schedule_save_settings()
         else:
             self.log("❌ Failed to apply layout - invalid configuration")
     # ===== BATCH PROCESSOR =====
@@ -881,7 +938,7 @@ class FPSAnalyzer(QMainWindow):
             self.setStyleSheet(self.theme_manager.get_light_theme())
         # Save theme preference
 
-        self.save_current_settings()
+        self.schedule_save_settings()
     # ===== PREVIEW SETTINGS =====
 
     def set_internal_resolution(self, width, height):
@@ -895,7 +952,7 @@ class FPSAnalyzer(QMainWindow):
             for action in self.resolution_actions:
                 action.setChecked(f"{width}x{height}" in action.text())
         self.refresh_current_frame()
-        self.save_current_settings()
+        self.schedule_save_settings()
     def set_preview_quality(self, interpolation):
         """Set preview quality and save"""
 
@@ -925,16 +982,18 @@ class FPSAnalyzer(QMainWindow):
                                 str(interpolation) in action.text())
         self.refresh_current_frame()
 
-        self.save_current_settings()
+        self.schedule_save_settings()
     def refresh_current_frame(self):
 
         """Refresh currently displayed frame"""
-        if hasattr(self, 'video_cap') and self.video_cap and self.video_cap.isOpened():
-            current_pos = self.video_cap.get(cv2.CAP_PROP_POS_FRAMES)
-            ret, frame = self.video_cap.read()
-            if ret:
-                self.display_frame(frame)
-                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, max(0, current_pos - 1))
+        # Re-render from the frame already decoded instead of reading and seeking back
+        if getattr(self, '_last_frame', None) is None or not (self.video_cap and self.video_cap.isOpened()):
+            return
+        if self._preview_pixmap is not None and self._preview_key == (self.internal_resolution, self.preview_quality):
+            # Only the widget size changed - rescale the cached pixmap
+            self._show_preview_pixmap()
+        else:
+            self.display_frame(self._last_frame)
     def resizeEvent(self, event):
         """Handle window resize"""
 
@@ -969,19 +1028,9 @@ class FPSAnalyzer(QMainWindow):
             from font_manager import FontPreviewDialog
             # Get current frame if video is loaded
 
-            current_frame = None
-
-            if self.video_cap and self.video_cap.isOpened():
-
-                current_pos = self.video_cap.get(cv2.CAP_PROP_POS_FRAMES)
-
-                ret, frame = self.video_cap.read()
-
-                if ret:
+            # Reuse the frame already on screen - no extra decode or seek
 
-                    current_frame = frame
-
-                    self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, max(0, current_pos - 1))
+            current_frame = self._last_frame if self.video_cap and self.video_cap.isOpened() else None
             # Open preview dialog
 
             preview_dialog = FontPreviewDialog(self, current_frame)
@@ -1108,7 +1157,7 @@ class FPSAnalyzer(QMainWindow):
                     self.log(f"  FPS: {fps_settings.font_name} Size:{fps_settings.size:.1f} Bold:{fps_settings.bold}")
                     # Save settings
 
-                    self.save_current_settings()
+                    self.schedule_save_settings()
 
             else:
 
@@ -1139,7 +1188,7 @@ class FPSAnalyzer(QMainWindow):
                     self.log(f"  Frame Rate: {framerate_color} | Frame Time: {frametime_color}")
                     # Save settings
 
-                    self.save_current_settings()
+                    self.schedule_save_settings()
                 else:
                     self.log("✗ Invalid color format detected")
         except Exception as e:
@@ -1152,6 +1201,10 @@ class FPSAnalyzer(QMainWindow):
 
         try:
 
+            # The worker needs the real font settings, not the startup placeholders
+
+            self.ensure_font_settings()
+
             # ✅ FIXED: Bitrate - handle OpenCV vs FFmpeg correctly
 
             bitrate_widget = self.bitrate_combo
@@ -1215,7 +1268,7 @@ class FPSAnalyzer(QMainWindow):
                 'show_frametime': self.show_frametime_checkbox.isChecked(),
                 'frametime_scale': frametime_scale,
                 'diff_threshold': diff_threshold,
-                'ftg_position': getattr(self, 'ftg_position', 'bottom_right'),
+                'ftg_position': self.ftg_position,
                 'font_settings': {
                     'fps_font': self.fps_font_settings,
                     'framerate_font': self.framerate_font_settings,
@@ -1240,7 +1293,7 @@ class FPSAnalyzer(QMainWindow):
                 print(f"   • {font_type}: {type(font).__name__}")
             # Save current settings for next session
 
-            self.save_current_settings()
+            self.schedule_save_settings()
             return settings
         except Exception as e:
 
@@ -1349,6 +1402,10 @@ class FPSAnalyzer(QMainWindow):
                 self.total_frames = video_info['frame_count']
 
                 self.video_fps = video_info['fps']
+            self._last_frame = None
+
+            self._preview_pixmap = None
+
             self.video_cap = cv2.VideoCapture(file_path)
 
             if not self.video_cap.isOpened():
@@ -1419,31 +1476,100 @@ class FPSAnalyzer(QMainWindow):
 
         try:
 
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # cv2 returns a fresh array per read, so keeping a reference is safe
+
+            self._last_frame = frame
 
-            h, w, ch = rgb_frame.shape
+            h, w = frame.shape[:2]
             target_width, target_height = self.internal_resolution
+            # 'Fast' shrinks with INTER_AREA: alias-free and far cheaper than Lanczos
 
-            rgb_frame = resize_with_aspect_ratio(rgb_frame, target_width, target_height)
-            h, w = target_height, target_width
-            q_image = QImage(rgb_frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
+            interpolation = self.preview_quality
 
-            pixmap = QPixmap.fromImage(q_image)
-            widget_size = self.preview_label.size()
+            if interpolation == cv2.INTER_LINEAR and (w > target_width or h > target_height):
 
-            scaled_pixmap = pixmap.scaled(
+                interpolation = cv2.INTER_AREA
+            if self._rgb_buf is None or self._rgb_buf.shape[:2] != (target_height, target_width):
 
-                widget_size,
+                self._rgb_buf = np.empty((target_height, target_width, 3), dtype=np.uint8)
 
-                Qt.AspectRatioMode.KeepAspectRatio,
+                self._qimg = QImage(self._rgb_buf.data, target_width, target_height, 3 * target_width, QImage.Format.Format_RGB888)
+            # cv2.cuda.resize has no Lanczos, that quality stays on the CPU
 
-                Qt.TransformationMode.SmoothTransformation
+            if self._gpu_frame is None or interpolation == cv2.INTER_LANCZOS4 or not self._resize_to_rgb_gpu(frame, interpolation):
 
-            )
-            self.preview_label.setPixmap(scaled_pixmap)
+                # Resize in BGR first, then convert the smaller frame into the reused buffer
+
+                resized = resize_with_aspect_ratio(frame, target_width, target_height, interpolation=interpolation)
+
+                cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            # fromImage copies the pixels, so the buffer can be overwritten next frame;
+            # NoFormatConversion skips the extra RGB888 -> native format pass where possible
+
+            self._preview_pixmap = QPixmap.fromImage(self._qimg, Qt.ImageConversionFlag.NoFormatConversion)
+
+            self._preview_key = (self.internal_resolution, self.preview_quality)
+
+            self._show_preview_pixmap()
         except Exception as e:
 
             self.log(f"✗ Could not display frame: {e}")
+    def _show_preview_pixmap(self):
+
+        """Scale the cached preview pixmap to the label size"""
+        widget_size = self.preview_label.size()
+
+        scaled_pixmap = self._preview_pixmap.scaled(
+
+            widget_size,
+
+            Qt.AspectRatioMode.KeepAspectRatio,
+
+            Qt.TransformationMode.SmoothTransformation
+
+        )
+        self.preview_label.setPixmap(scaled_pixmap)
+    def _resize_to_rgb_gpu(self, frame, interpolation):
+        """Letterbox-resize a BGR frame on the GPU into _rgb_buf, False if CUDA fails"""
+        target_height, target_width = self._rgb_buf.shape[:2]
+
+        h, w = frame.shape[:2]
+        # Same fit as resize_with_aspect_ratio
+
+        source_aspect = w / h
+
+        if source_aspect > target_width / target_height:
+
+            new_width, new_height = target_width, int(target_width / source_aspect)
+
+        else:
+
+            new_width, new_height = int(target_height * source_aspect), target_height
+        try:
+
+            self._gpu_frame.upload(frame)
+
+            cv2.cuda.resize(self._gpu_frame, (new_width, new_height), dst=self._gpu_resized, interpolation=interpolation)
+
+            cv2.cuda.cvtColor(self._gpu_resized, cv2.COLOR_BGR2RGB, dst=self._gpu_rgb)
+
+            rgb = self._gpu_rgb.download()
+        except cv2.error as e:
+
+            self.log(f"⚠️ GPU preview failed, using CPU from now on: {e}")
+
+            self._gpu_frame = self._gpu_resized = self._gpu_rgb = None
+
+            return False
+        y_offset = (target_height - new_height) // 2
+
+        x_offset = (target_width - new_width) // 2
+
+        self._rgb_buf.fill(0)
+
+        self._rgb_buf[y_offset:y_offset + new_height, x_offset:x_offset + new_width] = rgb
+
+        return True
     # ===== PLAYBACK CONTROLS =====
 
     def toggle_playback(self):
@@ -1559,7 +1685,7 @@ class FPSAnalyzer(QMainWindow):
 
             duration_frames = self.end_frame - self.start_frame
 
-            duration_time = self.frame_to_time_string(duration_frames)
+            duration_time = self._duration_str
 
             percentage = (duration_frames / self.total_frames * 100) if self.total_frames > 0 else 0
             # Ask for confirmation
@@ -1568,9 +1694,9 @@ class FPSAnalyzer(QMainWindow):
 
                                        f'🎯 Analyze selected segment only?\n\n'
 
-                                       f'📍 Start: {self.frame_to_time_string(self.start_frame)}\n'
+                                       f'📍 Start: {self._start_time_str}\n'
 
-                                       f'📍 End: {self.frame_to_time_string(self.end_frame)}\n'
+                                       f'📍 End: {self._end_time_str}\n'
 
                                        f'⏱️ Duration: {duration_time} ({duration_frames} frames)\n'
 
@@ -1592,7 +1718,7 @@ class FPSAnalyzer(QMainWindow):
 
             self.log(f"🎯 Starting SEGMENT FPS Analysis...")
 
-            self.log(f"📍 Segment: frames {self.start_frame}-{self.end_frame} ({self.frame_to_time_string(self.end_frame - self.start_frame)})")
+            self.log(f"📍 Segment: frames {self.start_frame}-{self.end_frame} ({self._duration_str})")
 
         else:
 
@@ -1681,7 +1807,7 @@ class FPSAnalyzer(QMainWindow):
             if os.path.exists(output_file):
                 file_size = os.path.getsize(output_file) / (1024*1024)
                 if mode_str == "segment":
-                    duration_time = self.frame_to_time_string(self.end_frame - self.start_frame)
+                    duration_time = self._duration_str
                     completion_msg = (f'🎉 Segment FPS Analysis completed successfully!\n\n'
                                     f'📁 Output file: {os.path.basename(output_file)}\n'
                                     f'📊 File size: {file_size:.1f} MB\n'
@@ -1710,7 +1836,19 @@ class FPSAnalyzer(QMainWindow):
 
         self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
 
-        print(f"[{timestamp}] {message}")
+        self._log_buf.append(f"[{timestamp}] {message}")
+
+        if not self._log_flush_timer.isActive():
+
+            self._log_flush_timer.start(16)
+    def _flush_log_buffer(self):
+
+        """Write buffered log lines to the console in one call"""
+        if self._log_buf:
+
+            sys.stdout.write('\n'.join(self._log_buf) + '\n')
+
+            self._log_buf.clear()
     # ===== CLEANUP =====
 
     def closeEvent(self, event):
@@ -1719,12 +1857,16 @@ class FPSAnalyzer(QMainWindow):
 
         # Save settings before closing
 
+        self._save_timer.stop()
+
         self.save_current_settings()
         if self.analysis_worker and self.analysis_worker.isRunning():
             self.analysis_worker.cancel()
             self.analysis_worker.wait(3000)
         if self.video_cap:
             self.video_cap.release()
+        self._log_flush_timer.stop()
+        self._flush_log_buffer()
         event.accept()
 # ===== APPLICATION SETUP =====
 def check_dependencies():
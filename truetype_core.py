@@ -52,37 +52,44 @@ class SystemFontDiscovery:
             'raleway', 'poppins', 'ubuntu', 'segoe ui', 'tahoma', 'comic sans',
             'impact', 'consolas', 'courier'
         ]
-        
-    def discover_fonts(self) -> List[Dict]:
-        """Discover ALL system fonts"""
-        if self.system_fonts:
-            return self.system_fonts
-            
-        font_paths = []
+        self.font_dirs = self._get_font_dirs()
+    
+    @staticmethod
+    def _get_font_dirs() -> List[str]:
+        """Font directories for the current OS"""
         system = platform.system().lower()
         
-        # Define font directories by OS
         if system == "windows":
-            font_dirs = [
+            return [
                 "C:/Windows/Fonts/",
                 os.path.expanduser("~/AppData/Local/Microsoft/Windows/Fonts/")
             ]
         elif system == "darwin":
-            font_dirs = [
+            return [
                 "/System/Library/Fonts/",
                 "/Library/Fonts/",
                 os.path.expanduser("~/Library/Fonts/")
             ]
         else:  # Linux
-            font_dirs = [
+            return [
                 "/usr/share/fonts/",
                 "/usr/local/share/fonts/",
                 os.path.expanduser("~/.fonts/"),
                 os.path.expanduser("~/.local/share/fonts/")
             ]
+    
+    def set_fonts(self, fonts: List[Dict]):
+        """Populate discovery state from a previously discovered font list"""
+        self.system_fonts = list(fonts)
+        self._font_cache = {font['name'].lower(): font for font in self.system_fonts}
         
+    def discover_fonts(self) -> List[Dict]:
+        """Discover ALL system fonts"""
+        if self.system_fonts:
+            return self.system_fonts
+            
         # Scan directories - ALLE FONTS
-        for font_dir in font_dirs:
+        for font_dir in self.font_dirs:
             if os.path.exists(font_dir):
                 for ext in ['*.ttf', '*.otf', '*.TTF', '*.OTF']:
                     pattern = os.path.join(font_dir, '**', ext)
@@ -149,10 +156,12 @@ class SystemFontDiscovery:
 class PillowOpenCVBridge:
     """Bridge between Pillow and OpenCV for font rendering"""
     
-    def __init__(self, cache_size=50):
+    def __init__(self, cache_size=50, font_discovery=None):
         self.available = PILLOW_AVAILABLE
         self._font_cache = {}
         self._cache_size = cache_size
+        # Name lookups reuse one discovery instead of rescanning per cache miss
+        self._font_discovery = font_discovery
     
     def load_system_font(self, font_name_or_path: str, size: int = 24, 
                         bold: bool = False, italic: bool = False) -> Optional[Any]:
@@ -171,8 +180,9 @@ class PillowOpenCVBridge:
                 font = ImageFont.truetype(font_name_or_path, size=size)
             else:
                 # Try to find font by name
-                discovery = SystemFontDiscovery()
-                font_info = discovery.get_font_by_name(font_name_or_path)
+                if self._font_discovery is None:
+                    self._font_discovery = SystemFontDiscovery()
+                font_info = self._font_discovery.get_font_by_name(font_name_or_path)
                 if font_info:
                     font = ImageFont.truetype(font_info['path'], size=size)
                 else: